@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
 from homeassistant.config_entries import ConfigEntry
@@ -18,9 +19,13 @@ from .const import (
     DOMAIN,
     PLATFORMS,
 )
-from .coordinator import FusionSolarDataUpdateCoordinator
+from .coordinator import FusionSolarDataUpdateCoordinator, merged_entry_config
 from .fusion_solar_api import FusionSolarApiClient
 
+CLIENTS_KEY = "_clients"
+
+_SETUP_LOCKS: dict[str, asyncio.Lock] = {}
+
 
 @dataclass(slots=True)
 class FusionSolarRuntimeData:
@@ -37,35 +42,50 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Huawei FusionSolar from a config entry."""
-    verify_ssl = entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
-    session = async_get_clientsession(hass, verify_ssl=verify_ssl)
-
-    host_override = entry.options.get(CONF_HOST_OVERRIDE) or entry.data.get(
-        CONF_HOST_OVERRIDE
-    )
-
-    api = FusionSolarApiClient(
-        session,
-        username=entry.data[CONF_USERNAME],
-        password=entry.data[CONF_PASSWORD],
-        preferred_host=host_override,
-        timeout_seconds=entry.options.get(
-            CONF_REQUEST_TIMEOUT_SECONDS,
-            DEFAULT_TIMEOUT_SECONDS,
-        ),
-        verify_ssl=verify_ssl,
-    )
-
-    coordinator = FusionSolarDataUpdateCoordinator(hass, entry, api)
-    await coordinator.async_config_entry_first_refresh()
-
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = FusionSolarRuntimeData(
-        api=api,
-        coordinator=coordinator,
-    )
-
-    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    lock = _SETUP_LOCKS.setdefault(entry.unique_id or entry.entry_id, asyncio.Lock())
+
+    # One setup (and therefore one login) at a time per account.
+    async with lock:
+        verify_ssl = entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+
+        config = merged_entry_config(entry)
+
+        # Reuse the client across reloads to keep its cookies and session.
+        # Timeout and host options are reapplied by the coordinator.
+        clients: dict[str, FusionSolarApiClient] = hass.data.setdefault(
+            DOMAIN, {}
+        ).setdefault(CLIENTS_KEY, {})
+        api = clients.get(entry.entry_id)
+        if (
+            api is not None
+            and api.username == entry.data[CONF_USERNAME]
+            and api.verify_ssl == verify_ssl
+        ):
+            api.update_credentials(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
+        else:
+            api = FusionSolarApiClient(
+                async_get_clientsession(hass, verify_ssl=verify_ssl),
+                username=entry.data[CONF_USERNAME],
+                password=entry.data[CONF_PASSWORD],
+                preferred_host=config.get(CONF_HOST_OVERRIDE),
+                timeout_seconds=config.get(
+                    CONF_REQUEST_TIMEOUT_SECONDS,
+                    DEFAULT_TIMEOUT_SECONDS,
+                ),
+                verify_ssl=verify_ssl,
+            )
+            clients[entry.entry_id] = api
+
+        coordinator = FusionSolarDataUpdateCoordinator(hass, entry, api)
+        await coordinator.async_config_entry_first_refresh()
+
+        hass.data.setdefault(DOMAIN, {})[entry.entry_id] = FusionSolarRuntimeData(
+            api=api,
+            coordinator=coordinator,
+        )
+
+        entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
@@ -73,10 +93,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        if domain_data := hass.data.get(DOMAIN):
+            domain_data.pop(entry.entry_id, None)
+        lock_key = entry.unique_id or entry.entry_id
+        lock = _SETUP_LOCKS.get(lock_key)
+        if lock is not None and not lock.locked():
+            _SETUP_LOCKS.pop(lock_key, None)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the cached API client when a config entry is removed."""
+    if (domain_data := hass.data.get(DOMAIN)) and (
+        clients := domain_data.get(CLIENTS_KEY)
+    ):
+        clients.pop(entry.entry_id, None)
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload integration when options change."""
     await hass.config_entries.async_reload(entry.entry_id)
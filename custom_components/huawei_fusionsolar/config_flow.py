@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -15,10 +16,12 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import (
     CONF_ENABLED_PLANT_IDS,
     CONF_HOST_OVERRIDE,
+    CONF_MAX_CONCURRENT_FETCHES,
     CONF_PLANT_INDEX,
     CONF_POLL_INTERVAL_SECONDS,
     CONF_REQUEST_TIMEOUT_SECONDS,
     CONF_VERIFY_SSL,
+    DEFAULT_MAX_CONCURRENT_FETCHES,
     DEFAULT_POLL_INTERVAL_SECONDS,
     DEFAULT_TIMEOUT_SECONDS,
     DEFAULT_VERIFY_SSL,
@@ -32,11 +35,14 @@ from .fusion_solar_api import (
     RateLimited,
 )
 
+_HOST_RE = re.compile(r"^\s*(?:https?://)?(.*?)/*\s*$", re.IGNORECASE)
+
 
 def _normalize_host(host: str | None) -> str | None:
     if not host:
         return None
-    return host.strip().lower().replace("https://", "").replace("http://", "").rstrip("/")
+    match = _HOST_RE.match(host)
+    return match.group(1).lower() if match else host.strip().lower()
 
 
 async def _async_validate_input(
@@ -248,6 +254,9 @@ class FusionSolarOptionsFlow(config_entries.OptionsFlow):
                 CONF_REQUEST_TIMEOUT_SECONDS: int(
                     user_input[CONF_REQUEST_TIMEOUT_SECONDS]
                 ),
+                CONF_MAX_CONCURRENT_FETCHES: int(
+                    user_input[CONF_MAX_CONCURRENT_FETCHES]
+                ),
                 CONF_HOST_OVERRIDE: _normalize_host(user_input.get(CONF_HOST_OVERRIDE)),
             }
 
@@ -280,6 +289,13 @@ class FusionSolarOptionsFlow(config_entries.OptionsFlow):
                     DEFAULT_TIMEOUT_SECONDS,
                 ),
             ): vol.All(vol.Coerce(int), vol.Range(min=5, max=120)),
+            vol.Required(
+                CONF_MAX_CONCURRENT_FETCHES,
+                default=self.entry.options.get(
+                    CONF_MAX_CONCURRENT_FETCHES,
+                    DEFAULT_MAX_CONCURRENT_FETCHES,
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
             vol.Optional(
                 CONF_HOST_OVERRIDE,
                 default=self.entry.options.get(CONF_HOST_OVERRIDE)
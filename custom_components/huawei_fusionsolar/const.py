@@ -11,6 +11,7 @@ DEFAULT_HOST = "la5.fusionsolar.huawei.com"
 DEFAULT_VERIFY_SSL = True
 DEFAULT_TIMEOUT_SECONDS = 15
 DEFAULT_POLL_INTERVAL_SECONDS = 60
+DEFAULT_MAX_CONCURRENT_FETCHES = 4
 MAX_BACKOFF_SECONDS = 600
 
 CONF_HOST_OVERRIDE = "host_override"
@@ -18,11 +19,14 @@ CONF_VERIFY_SSL = "verify_ssl"
 CONF_ENABLED_PLANT_IDS = "enabled_plant_ids"
 CONF_POLL_INTERVAL_SECONDS = "poll_interval_seconds"
 CONF_REQUEST_TIMEOUT_SECONDS = "request_timeout_seconds"
+CONF_MAX_CONCURRENT_FETCHES = "max_concurrent_fetches"
 CONF_PLANT_INDEX = "plant_index"
 
-OPTIONAL_DATA_KEYS = {
-    CONF_HOST_OVERRIDE,
-    CONF_VERIFY_SSL,
-}
+OPTIONAL_DATA_KEYS = frozenset(
+    {
+        CONF_HOST_OVERRIDE,
+        CONF_VERIFY_SSL,
+    }
+)
 
 DEFAULT_UPDATE_INTERVAL = timedelta(seconds=DEFAULT_POLL_INTERVAL_SECONDS)
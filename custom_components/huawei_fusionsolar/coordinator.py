@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -15,8 +18,10 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 from .const import (
     CONF_ENABLED_PLANT_IDS,
     CONF_HOST_OVERRIDE,
+    CONF_MAX_CONCURRENT_FETCHES,
     CONF_POLL_INTERVAL_SECONDS,
     CONF_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_MAX_CONCURRENT_FETCHES,
     DEFAULT_POLL_INTERVAL_SECONDS,
     DEFAULT_TIMEOUT_SECONDS,
     DOMAIN,
@@ -27,6 +32,7 @@ from .fusion_solar_api import (
     EndpointSchemaChanged,
     FusionSolarApiClient,
     InvalidAuth,
+    PlantInfo,
     PlantSnapshot,
     RateLimited,
 )
@@ -34,7 +40,23 @@ from .fusion_solar_api import (
 LOGGER = logging.getLogger(__name__)
 
 
-class FusionSolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, PlantSnapshot]]):
+def merged_entry_config(entry: ConfigEntry) -> MappingProxyType[str, Any]:
+    """Return a read-only view of entry data overlaid with non-empty options."""
+    return MappingProxyType(
+        {
+            **entry.data,
+            **{
+                key: value
+                for key, value in entry.options.items()
+                if value not in (None, "")
+            },
+        }
+    )
+
+
+class FusionSolarDataUpdateCoordinator(
+    DataUpdateCoordinator[Mapping[str, PlantSnapshot]]
+):
     """Handle FusionSolar data updates for one account."""
 
     config_entry: ConfigEntry
@@ -50,18 +72,30 @@ class FusionSolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, PlantSnap
         self._failure_count = 0
         self._last_success_at_utc: datetime | None = None
         self._known_plants: dict[str, str] = {}
+        self._known_plants_view = MappingProxyType(self._known_plants)
+        self._merged: MappingProxyType[str, Any] = MappingProxyType({})
+        self._cached_poll_interval = DEFAULT_POLL_INTERVAL_SECONDS
+        self._cached_timeout = DEFAULT_TIMEOUT_SECONDS
+        self._cached_enabled_ids: frozenset[str] = frozenset()
+        self._cached_host_override: str | None = None
+        self._normal_interval = timedelta(seconds=DEFAULT_POLL_INTERVAL_SECONDS)
+        self._backoff_ladder: tuple[timedelta, ...] = ()
+        self._cached_max_concurrent = DEFAULT_MAX_CONCURRENT_FETCHES
+        self._metrics_sem = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_FETCHES)
+        self._inflight: dict[str, asyncio.Future[PlantSnapshot]] = {}
+        self.refresh_options()
 
         super().__init__(
             hass,
             LOGGER,
             name=f"{DOMAIN}_{entry.entry_id}",
-            update_interval=timedelta(seconds=self._poll_interval_seconds),
+            update_interval=self._normal_interval,
         )
 
     @property
-    def known_plants(self) -> dict[str, str]:
-        """Return discovered plants (id -> name)."""
-        return dict(self._known_plants)
+    def known_plants(self) -> Mapping[str, str]:
+        """Return a read-only view of discovered plants (id -> name)."""
+        return self._known_plants_view
 
     @property
     def last_success_at_utc(self) -> datetime | None:
@@ -70,53 +104,132 @@ class FusionSolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, PlantSnap
 
     @property
     def _poll_interval_seconds(self) -> int:
-        value = self.config_entry.options.get(
-            CONF_POLL_INTERVAL_SECONDS,
-            DEFAULT_POLL_INTERVAL_SECONDS,
-        )
-        try:
-            return max(30, int(value))
-        except (TypeError, ValueError):
-            return DEFAULT_POLL_INTERVAL_SECONDS
+        return self._cached_poll_interval
 
     @property
     def _request_timeout_seconds(self) -> int:
-        value = self.config_entry.options.get(
-            CONF_REQUEST_TIMEOUT_SECONDS,
-            DEFAULT_TIMEOUT_SECONDS,
+        return self._cached_timeout
+
+    @property
+    def _enabled_plant_ids(self) -> frozenset[str]:
+        return self._cached_enabled_ids
+
+    def refresh_options(self) -> None:
+        """Parse config entry options once and push them to the API client."""
+        self._merged = options = merged_entry_config(self.config_entry)
+
+        value = options.get(CONF_POLL_INTERVAL_SECONDS, DEFAULT_POLL_INTERVAL_SECONDS)
+        try:
+            self._cached_poll_interval = max(30, int(value))
+        except (TypeError, ValueError):
+            self._cached_poll_interval = DEFAULT_POLL_INTERVAL_SECONDS
+
+        self._normal_interval = timedelta(seconds=self._cached_poll_interval)
+        ladder = [min(MAX_BACKOFF_SECONDS, self._cached_poll_interval * 2)]
+        while ladder[-1] < MAX_BACKOFF_SECONDS:
+            ladder.append(min(MAX_BACKOFF_SECONDS, ladder[-1] * 2))
+        self._backoff_ladder = tuple(timedelta(seconds=seconds) for seconds in ladder)
+        self._failure_count = min(self._failure_count, len(ladder))
+
+        value = options.get(CONF_REQUEST_TIMEOUT_SECONDS, DEFAULT_TIMEOUT_SECONDS)
+        try:
+            self._cached_timeout = max(5, int(value))
+        except (TypeError, ValueError):
+            self._cached_timeout = DEFAULT_TIMEOUT_SECONDS
+
+        enabled = options.get(CONF_ENABLED_PLANT_IDS)
+        self._cached_enabled_ids = (
+            frozenset(str(plant_id) for plant_id in enabled) if enabled else frozenset()
         )
+
+        value = options.get(CONF_MAX_CONCURRENT_FETCHES, DEFAULT_MAX_CONCURRENT_FETCHES)
         try:
-            return max(5, int(value))
+            max_concurrent = max(1, int(value))
         except (TypeError, ValueError):
-            return DEFAULT_TIMEOUT_SECONDS
+            max_concurrent = DEFAULT_MAX_CONCURRENT_FETCHES
+        if max_concurrent != self._cached_max_concurrent:
+            self._cached_max_concurrent = max_concurrent
+            self._metrics_sem = asyncio.Semaphore(max_concurrent)
 
-    @property
-    def _enabled_plant_ids(self) -> set[str]:
-        enabled = self.config_entry.options.get(CONF_ENABLED_PLANT_IDS)
-        if not enabled:
-            return set()
-        return {str(plant_id) for plant_id in enabled}
+        self._cached_host_override = options.get(CONF_HOST_OVERRIDE)
+
+        self.api.set_timeout_seconds(self._cached_timeout)
+        self.api.set_preferred_host(self._cached_host_override)
+        # Reuse metrics younger than half a poll so reloads and manual refreshes
+        # skip the network, while scheduled polls always fetch fresh values.
+        self.api.set_metrics_cache_ttl(self._cached_poll_interval / 2)
 
     def _apply_backoff(self) -> None:
-        self._failure_count += 1
-        next_seconds = min(
-            MAX_BACKOFF_SECONDS,
-            self._poll_interval_seconds * (2**self._failure_count),
-        )
-        self.update_interval = timedelta(seconds=next_seconds)
+        self._failure_count = min(self._failure_count + 1, len(self._backoff_ladder))
+        self.update_interval = self._backoff_ladder[self._failure_count - 1]
 
     def _clear_backoff(self) -> None:
         self._failure_count = 0
-        self.update_interval = timedelta(seconds=self._poll_interval_seconds)
-
-    async def _async_update_data(self) -> dict[str, PlantSnapshot]:
-        """Fetch data from FusionSolar and normalize it."""
-        self.api.set_timeout_seconds(self._request_timeout_seconds)
-        self.api.set_preferred_host(
-            self.config_entry.options.get(CONF_HOST_OVERRIDE)
-            or self.config_entry.data.get(CONF_HOST_OVERRIDE)
-        )
+        self.update_interval = self._normal_interval
+
+    def _update_known_plants(self, plants: list[PlantInfo]) -> None:
+        """Rebuild the plant name map only when ids or names changed."""
+        known_plants = self._known_plants
+        if len(plants) == len(known_plants) and all(
+            known_plants.get(plant.plant_id) == plant.plant_name for plant in plants
+        ):
+            return
+        self._known_plants = {plant.plant_id: plant.plant_name for plant in plants}
+        self._known_plants_view = MappingProxyType(self._known_plants)
+
+    async def _async_fetch_metrics(self, plant_id: str) -> PlantSnapshot:
+        """Fetch one plant's metrics, sharing any request already in flight."""
+        inflight = self._inflight.get(plant_id)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[PlantSnapshot] = self.hass.loop.create_future()
+        self._inflight[plant_id] = future
+        try:
+            async with self._metrics_sem:
+                result = await self.api.async_get_metrics(plant_id)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            # Mark as retrieved so a failure nobody else awaited is not logged.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(plant_id, None)
+
+    async def _async_fetch_all_metrics(
+        self,
+        plants: list[PlantInfo],
+    ) -> list[PlantSnapshot | Exception]:
+        """Fetch metrics for all plants, cancelling the rest on auth failure."""
+
+        async def _fetch(plant_id: str) -> PlantSnapshot | Exception:
+            try:
+                return await self._async_fetch_metrics(plant_id)
+            except InvalidAuth:
+                raise
+            except Exception as err:  # noqa: BLE001 - reported as partial failure
+                return err
 
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_fetch(plant.plant_id)) for plant in plants]
+        except* InvalidAuth as err_group:
+            raise ConfigEntryAuthFailed from err_group.exceptions[0]
+
+        return [task.result() for task in tasks]
+
+    async def _async_update_data(self) -> Mapping[str, PlantSnapshot]:
+        """Fetch data from FusionSolar and normalize it.
+
+        The snapshots are returned as a read-only view so entities cannot
+        mutate shared coordinator data.
+        """
         try:
             plants = await self.api.async_get_plants()
         except InvalidAuth as err:
@@ -133,47 +246,35 @@ class FusionSolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, PlantSnap
         if not plants:
             raise UpdateFailed("No plants returned by FusionSolar")
 
-        self._known_plants = {plant.plant_id: plant.plant_name for plant in plants}
+        self._update_known_plants(plants)
+
+        # The config flow enables every discovered plant by default, so a
+        # filter covering all known plants is the common case: skip it too.
         enabled_plant_ids = self._enabled_plant_ids
-        selected_plants = [
-            plant
-            for plant in plants
-            if not enabled_plant_ids or plant.plant_id in enabled_plant_ids
-        ]
+        selected_plants = (
+            plants
+            if not enabled_plant_ids or enabled_plant_ids.issuperset(self._known_plants)
+            else [plant for plant in plants if plant.plant_id in enabled_plant_ids]
+        )
 
         if not selected_plants:
             raise UpdateFailed("No plants selected for polling")
 
-        results = await asyncio.gather(
-            *(self.api.async_get_metrics(plant.plant_id) for plant in selected_plants),
-            return_exceptions=True,
-        )
+        results = await self._async_fetch_all_metrics(selected_plants)
 
-        previous_data = self.data if isinstance(self.data, dict) else {}
+        previous_data: Mapping[str, PlantSnapshot] = self.data or {}
         snapshots: dict[str, PlantSnapshot] = {}
         partial_errors: list[tuple[str, Exception]] = []
 
         for plant, result in zip(selected_plants, results, strict=True):
             if isinstance(result, Exception):
-                if isinstance(result, InvalidAuth):
-                    raise ConfigEntryAuthFailed from result
-
                 partial_errors.append((plant.plant_id, result))
                 if plant.plant_id in previous_data:
                     snapshots[plant.plant_id] = previous_data[plant.plant_id]
                 continue
 
             if not result.plant_name:
-                result = PlantSnapshot(
-                    plant_id=result.plant_id,
-                    plant_name=plant.plant_name,
-                    power_w=result.power_w,
-                    energy_today_kwh=result.energy_today_kwh,
-                    energy_month_kwh=result.energy_month_kwh,
-                    energy_year_kwh=result.energy_year_kwh,
-                    energy_total_kwh=result.energy_total_kwh,
-                    updated_at_utc=result.updated_at_utc,
-                )
+                result = replace(result, plant_name=plant.plant_name)
 
             snapshots[plant.plant_id] = result
 
@@ -181,15 +282,17 @@ class FusionSolarDataUpdateCoordinator(DataUpdateCoordinator[dict[str, PlantSnap
             self._apply_backoff()
             raise UpdateFailed("All plant requests failed")
 
-        if partial_errors:
-            error_summary = ", ".join(
-                f"{plant_id}:{type(err).__name__}" for plant_id, err in partial_errors
+        if partial_errors and LOGGER.isEnabledFor(logging.WARNING):
+            LOGGER.warning(
+                "Partial FusionSolar update failure: %s",
+                ", ".join(
+                    f"{plant_id}:{type(err).__name__}" for plant_id, err in partial_errors
+                ),
             )
-            LOGGER.warning("Partial FusionSolar update failure: %s", error_summary)
 
         self._last_success_at_utc = datetime.now(UTC)
         self._clear_backoff()
-        return snapshots
+        return MappingProxyType(snapshots)
 
     def diagnostics_payload(self) -> dict[str, Any]:
         """Return coordinator state useful for diagnostics."""
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
-from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.components.diagnostics import REDACTED
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
@@ -12,15 +13,47 @@ from homeassistant.core import HomeAssistant
 from . import FusionSolarRuntimeData
 from .const import DOMAIN
 
-TO_REDACT = {
-    CONF_PASSWORD,
-    "cookie",
-    "cookies",
-    "token",
-    "csrf",
-    "session",
-    "authorization",
-}
+TO_REDACT = frozenset(
+    {
+        CONF_PASSWORD,
+        "cookie",
+        "cookies",
+        "token",
+        "csrf",
+        "session",
+        "authorization",
+    }
+)
+
+
+def _redacted(
+    mapping: Mapping[str, Any],
+    to_redact: frozenset[str],
+    *,
+    skip: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    """Copy a flat config mapping once, redacting and skipping keys inline."""
+    return {
+        key: REDACTED if key in to_redact and value not in (None, "") else value
+        for key, value in mapping.items()
+        if key not in skip
+    }
+
+
+def _redact_nested(data: Any) -> Any:
+    """Copy a nested runtime payload, redacting TO_REDACT keys case-insensitively."""
+    if isinstance(data, list):
+        return [_redact_nested(item) for item in data]
+    if not isinstance(data, Mapping):
+        return data
+    return {
+        key: (
+            REDACTED
+            if str(key).lower() in TO_REDACT and value not in (None, "")
+            else _redact_nested(value)
+        )
+        for key, value in data.items()
+    }
 
 
 def _mask_username(username: str | None) -> str | None:
@@ -36,14 +69,11 @@ async def async_get_config_entry_diagnostics(
     entry: ConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    entry_data = dict(entry.data)
-    options_data = dict(entry.options)
-
-    username_masked = _mask_username(entry_data.get(CONF_USERNAME))
-    if CONF_USERNAME in entry_data:
-        entry_data.pop(CONF_USERNAME)
+    username_masked = _mask_username(entry.data.get(CONF_USERNAME))
 
-    runtime: FusionSolarRuntimeData | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    runtime: FusionSolarRuntimeData | None = (
+        hass.data[DOMAIN].get(entry.entry_id) if DOMAIN in hass.data else None
+    )
     runtime_payload: dict[str, Any] = {}
     if runtime is not None:
         runtime_payload = {
@@ -52,8 +82,8 @@ async def async_get_config_entry_diagnostics(
         }
 
     return {
-        "config_entry": async_redact_data(entry_data, TO_REDACT),
-        "config_entry_options": async_redact_data(options_data, TO_REDACT),
+        "config_entry": _redacted(entry.data, TO_REDACT, skip=(CONF_USERNAME,)),
+        "config_entry_options": _redacted(entry.options, TO_REDACT),
         "username_masked": username_masked,
-        "runtime": async_redact_data(runtime_payload, TO_REDACT),
+        "runtime": _redact_nested(runtime_payload),
     }
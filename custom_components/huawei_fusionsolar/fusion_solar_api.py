@@ -2,21 +2,37 @@
 
 from __future__ import annotations
 
-from collections import deque
-from dataclasses import dataclass
-from datetime import UTC, datetime
+import asyncio
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time as dt_time, timedelta
+from functools import lru_cache
 import json
 import logging
-from typing import Any, Iterable
+import re
+import sys
+import time
+from typing import Any, Callable, Iterator
 from urllib.parse import parse_qs, urlparse
 
 import aiohttp
+from multidict import CIMultiDictProxy
 from yarl import URL
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 from .const import DEFAULT_HOST, DEFAULT_TIMEOUT_SECONDS
 
 LOGGER = logging.getLogger(__name__)
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib error type.
+_json_loads: Callable[[str], Any] = orjson.loads if orjson is not None else json.loads
+
+
 VALIDATE_USER_PATH = "/rest/dp/uidm/unisso/v1/validate-user"
 SSO_READY_PATH = "/rest/dp/uidm/auth/v1/on-sso-credential-ready"
 LOGIN_REDIRECT_PATH = "/rest/pvms/web/login/v1/redirecturl"
@@ -31,6 +47,22 @@ DEPLOYMENT_PATH = "/rest/dp/pvms/pvmswebsite/v1/deployment"
 KEEPALIVE_PATH = "/rest/dpcloud/auth/v1/keep-alive"
 STATION_LIST_PATH = "/rest/pvms/web/station/v1/station/station-list"
 STATION_REAL_KPI_PATH = "/rest/pvms/web/station/v1/overview/station-real-kpi"
+STATION_PATH_PREFIX = "/rest/pvms/web/station/"
+
+# Endpoints that receive browser-like Origin/Referer login headers.
+LOGIN_ENDPOINTS = frozenset(
+    {
+        VALIDATE_USER_PATH,
+        SSO_READY_PATH,
+        LOGIN_REDIRECT_PATH,
+        VERIFY_CODE_CHECK_PATH,
+        LIST_UNFORBIDDEN_SERVER_PATH,
+    }
+)
+# Login steps themselves must never trigger a relogin on 401/403.
+AUTH_RETRY_EXCLUDED_ENDPOINTS = frozenset(
+    {VALIDATE_USER_PATH, SSO_READY_PATH, LOGIN_REDIRECT_PATH}
+)
 
 LEGACY_LOGIN_ENDPOINT_CANDIDATES: tuple[str, ...] = (
     "/rest/pvms/web/station/v1/login",
@@ -45,74 +77,128 @@ BROWSER_USER_AGENT = (
     "(KHTML, like Gecko) Chrome/145.0.0.0 Safari/537.36"
 )
 
-LOGIN_ERROR_CODES = {
-    "401",
-    "403",
-    "100001",
-    "100002",
-    "USER_PASSWORD_ERROR",
-    "USER_NOT_EXIST",
-}
+LOGIN_ERROR_CODES = frozenset(
+    {
+        "401",
+        "403",
+        "100001",
+        "100002",
+        "USER_PASSWORD_ERROR",
+        "USER_NOT_EXIST",
+    }
+)
 
-PLANT_ID_KEYS = (
-    "dn",
-    "stationDn",
-    "stationCode",
-    "plantId",
-    "stationId",
-    "id",
+_LOGIN_ERROR_MESSAGE_RE = re.compile(
+    r"password.*(?:wrong|invalid|error)|(?:wrong|invalid|error).*password",
+    re.IGNORECASE | re.DOTALL,
 )
 
-PLANT_NAME_KEYS = (
-    "name",
-    "stationName",
-    "plantName",
-    "stationAlias",
+PLANT_ID_KEYS = frozenset(
+    {
+        "dn",
+        "stationdn",
+        "stationcode",
+        "plantid",
+        "stationid",
+        "id",
+    }
+)
+
+PLANT_NAME_KEYS = frozenset(
+    {
+        "name",
+        "stationname",
+        "plantname",
+        "stationalias",
+    }
 )
 
-POWER_KEYS = (
-    "currentPower",
-    "activePower",
-    "realTimePower",
-    "power",
-    "pac",
+POWER_KEYS = frozenset(
+    {
+        "currentpower",
+        "activepower",
+        "realtimepower",
+        "power",
+        "pac",
+    }
 )
 
-POWER_UNIT_KEYS = (
-    "powerUnit",
-    "activePowerUnit",
-    "onlyInverterPowerUnit",
-    "unit",
+POWER_UNIT_KEYS = frozenset(
+    {
+        "powerunit",
+        "activepowerunit",
+        "onlyinverterpowerunit",
+        "unit",
+    }
 )
 
-ENERGY_TODAY_KEYS = (
-    "dailyEnergy",
-    "energyToday",
-    "dayEnergy",
-    "todayEnergy",
+ENERGY_TODAY_KEYS = frozenset(
+    {
+        "dailyenergy",
+        "energytoday",
+        "dayenergy",
+        "todayenergy",
+    }
 )
 
-ENERGY_MONTH_KEYS = (
-    "monthEnergy",
-    "energyMonth",
-    "monthlyEnergy",
+ENERGY_MONTH_KEYS = frozenset(
+    {
+        "monthenergy",
+        "energymonth",
+        "monthlyenergy",
+    }
 )
 
-ENERGY_YEAR_KEYS = (
-    "yearEnergy",
-    "energyYear",
-    "annualEnergy",
+ENERGY_YEAR_KEYS = frozenset(
+    {
+        "yearenergy",
+        "energyyear",
+        "annualenergy",
+    }
 )
 
-ENERGY_TOTAL_KEYS = (
-    "cumulativeEnergy",
-    "totalEnergy",
-    "energyTotal",
-    "accumulatedEnergy",
-    "lifetimeEnergy",
+ENERGY_TOTAL_KEYS = frozenset(
+    {
+        "cumulativeenergy",
+        "totalenergy",
+        "energytotal",
+        "accumulatedenergy",
+        "lifetimeenergy",
+    }
 )
 
-CSRF_KEYS = ("csrf", "csrfToken", "token", "xsrftoken")
+CSRF_KEYS = frozenset({"csrf", "csrftoken", "token", "xsrftoken"})
+# Wrapper keys checked by shallow lookups on non-login responses.
+SHALLOW_CONTAINER_KEYS: tuple[str, ...] = ("data", "payload")
+
+METRIC_KEY_GROUPS: dict[str, frozenset[str]] = {
+    "power": POWER_KEYS,
+    "unit": POWER_UNIT_KEYS,
+    "today": ENERGY_TODAY_KEYS,
+    "month": ENERGY_MONTH_KEYS,
+    "year": ENERGY_YEAR_KEYS,
+    "total": ENERGY_TOTAL_KEYS,
+    "name": PLANT_NAME_KEYS,
+}
+
+# Lowercase payload key -> metric groups it fills, built once at import.
+METRIC_KEY_INDEX: dict[str, tuple[str, ...]] = {
+    key: tuple(group for group, keys in METRIC_KEY_GROUPS.items() if key in keys)
+    for keys in METRIC_KEY_GROUPS.values()
+    for key in keys
+}
+
+# Power keys reported in kW even when no unit accompanies the value.
+KW_POWER_KEYS = frozenset({"currentpower", "inverterpower"})
+
+METRICS_CACHE_MAX_ENTRIES = 32
+
+# A successful authenticated response this recent makes a keep-alive
+# round trip redundant before the next request.
+SESSION_CONFIRMED_SECONDS = 60
+
+# Number of (endpoint, status, timestamp) entries kept for diagnostics.
+RECENT_STATUS_HISTORY = 25
 
 
 class FusionSolarApiError(Exception):
@@ -154,7 +240,8 @@ class PlantSnapshot:
     energy_month_kwh: float
     energy_year_kwh: float
     energy_total_kwh: float
-    updated_at_utc: datetime
+    # Parse time only: two polls with the same telemetry compare equal.
+    updated_at_utc: datetime = field(compare=False)
 
 
 @dataclass(slots=True)
@@ -164,7 +251,7 @@ class _RawResponse:
     status: int
     payload: Any
     url: URL
-    headers: dict[str, str]
+    headers: CIMultiDictProxy[str]
 
 
 class FusionSolarApiClient:
@@ -179,6 +266,7 @@ class FusionSolarApiClient:
         preferred_host: str | None = None,
         timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
         verify_ssl: bool = True,
+        keepalive_skip_seconds: float = SESSION_CONFIRMED_SECONDS,
     ) -> None:
         self._session = session
         self._username = username
@@ -186,20 +274,47 @@ class FusionSolarApiClient:
         self._preferred_host = _sanitize_host(preferred_host) if preferred_host else None
         self._effective_host = self._preferred_host or DEFAULT_HOST
         self._timeout_seconds = timeout_seconds
+        self._client_timeout = aiohttp.ClientTimeout(total=timeout_seconds)
         self._verify_ssl = verify_ssl
         self._csrf_token: str | None = None
         self._roarand_token: str | None = None
         self._session_valid = False
-        self._recent_statuses: deque[dict[str, str | int]] = deque(maxlen=25)
+        self._keepalive_skip_seconds = keepalive_skip_seconds
+        self._last_ok_at = float("-inf")
+        self._recent_statuses: deque[tuple[str, int, float]] = deque(
+            maxlen=RECENT_STATUS_HISTORY
+        )
         self._plant_names: dict[str, str] = {}
+        self._metrics_cache: OrderedDict[str, tuple[float, PlantSnapshot]] = OrderedDict()
+        self._metrics_cache_ttl = 0.0
+        self._base_headers = {
+            "Accept": "application/json, text/javascript, */*; q=0.01",
+            "X-Requested-With": "XMLHttpRequest",
+            "User-Agent": BROWSER_USER_AGENT,
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+        self._host_headers: dict[str, dict[str, str]] = {}
 
     @property
     def effective_host(self) -> str:
         """Return current effective host."""
         return self._effective_host
 
+    @property
+    def username(self) -> str | None:
+        """Return configured username."""
+        return self._username
+
+    @property
+    def verify_ssl(self) -> bool:
+        """Return whether TLS certificates are verified."""
+        return self._verify_ssl
+
     def update_credentials(self, username: str, password: str) -> None:
-        """Update credentials in memory."""
+        """Update credentials in memory, dropping the session if they changed."""
+        if username != self._username or password != self._password:
+            self._session_valid = False
+            self._roarand_token = None
         self._username = username
         self._password = password
 
@@ -211,7 +326,13 @@ class FusionSolarApiClient:
 
     def set_timeout_seconds(self, timeout_seconds: int) -> None:
         """Set request timeout in seconds."""
-        self._timeout_seconds = timeout_seconds
+        if timeout_seconds != self._timeout_seconds:
+            self._timeout_seconds = timeout_seconds
+            self._client_timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+
+    def set_metrics_cache_ttl(self, ttl_seconds: float) -> None:
+        """Set how long fetched metrics may be reused (0 disables reuse)."""
+        self._metrics_cache_ttl = ttl_seconds
 
     async def async_login(
         self,
@@ -230,8 +351,12 @@ class FusionSolarApiClient:
         if not self._username or not self._password:
             raise InvalidAuth("Missing credentials")
 
-        host_candidates = _dedupe(
-            [self._preferred_host, self._effective_host, DEFAULT_HOST]
+        host_candidates = list(
+            dict.fromkeys(
+                host
+                for host in (self._preferred_host, self._effective_host, DEFAULT_HOST)
+                if host
+            )
         )
 
         login_payload = {
@@ -378,31 +503,54 @@ class FusionSolarApiClient:
 
     async def _async_prelogin_probes(self, host: str) -> None:
         """Run lightweight pre-login endpoints to warm session cookies."""
-        probes: tuple[
-            tuple[str, str, dict[str, Any] | None, dict[str, str] | None], ...
-        ] = (
-            ("GET", LOGIN_PAGE_PATH, None, None),
-            ("GET", LANGUAGE_PATH, None, None),
-            ("GET", DEPLOYMENT_PATH, None, None),
-            ("GET", VERIFY_CODE_CHECK_PATH, None, {"app-id": LOGIN_APP_ID}),
-            ("POST", LIST_UNFORBIDDEN_SERVER_PATH, {}, {"app-id": LOGIN_APP_ID}),
+        # The login page hands out the initial session cookie, so load it
+        # first and fire the remaining independent probes concurrently.
+        await self._async_prelogin_probe(host, "GET", LOGIN_PAGE_PATH)
+        await asyncio.gather(
+            self._async_prelogin_probe(host, "GET", LANGUAGE_PATH),
+            self._async_prelogin_probe(host, "GET", DEPLOYMENT_PATH),
+            self._async_prelogin_probe(
+                host,
+                "GET",
+                VERIFY_CODE_CHECK_PATH,
+                extra_headers={"app-id": LOGIN_APP_ID},
+            ),
+            self._async_prelogin_probe(
+                host,
+                "POST",
+                LIST_UNFORBIDDEN_SERVER_PATH,
+                payload={},
+                extra_headers={"app-id": LOGIN_APP_ID},
+            ),
         )
-        for method, endpoint, payload, extra_headers in probes:
-            try:
-                await self._request_raw(
-                    method,
-                    endpoint,
-                    host=host,
-                    json_data=payload,
-                    extra_headers=extra_headers,
-                    allow_auth_retry=False,
-                )
-            except Exception as err:  # noqa: BLE001 - best-effort probe
-                LOGGER.debug("Pre-login probe failed (%s): %s", endpoint, err)
+
+    async def _async_prelogin_probe(
+        self,
+        host: str,
+        method: str,
+        endpoint: str,
+        *,
+        payload: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> None:
+        """Run one best-effort pre-login request, logging failures."""
+        try:
+            await self._request_raw(
+                method,
+                endpoint,
+                host=host,
+                json_data=payload,
+                extra_headers=extra_headers,
+                allow_auth_retry=False,
+            )
+        except Exception as err:  # noqa: BLE001 - best-effort probe
+            LOGGER.debug("Pre-login probe failed (%s): %s", endpoint, err)
 
     async def async_refresh_session(self) -> None:
         """Refresh session and fallback to full relogin when needed."""
         if self._session_valid:
+            if self._session_recently_confirmed():
+                return
             try:
                 await self._async_refresh_roarand_token()
                 self._session_valid = True
@@ -419,6 +567,13 @@ class FusionSolarApiClient:
         )
         await self._async_refresh_roarand_token()
 
+    def _session_recently_confirmed(self) -> bool:
+        """Return True when a recent authenticated response proved the session."""
+        return (
+            self._roarand_token is not None
+            and time.monotonic() - self._last_ok_at < self._keepalive_skip_seconds
+        )
+
     async def _async_refresh_roarand_token(self) -> None:
         """Refresh dynamic roarand token from keep-alive endpoint."""
         response = await self._request_raw(
@@ -434,7 +589,7 @@ class FusionSolarApiClient:
         """Fetch plant list from account."""
         if not self._session_valid:
             await self.async_refresh_session()
-        else:
+        elif not self._session_recently_confirmed():
             await self._async_refresh_roarand_token()
 
         response = await self._request_raw(
@@ -451,16 +606,43 @@ class FusionSolarApiClient:
 
     async def async_get_metrics(self, plant_id: str) -> PlantSnapshot:
         """Fetch normalized telemetry metrics for one plant."""
+        cached = self._get_cached_metrics(plant_id)
+        if cached is not None:
+            return cached
+
+        await self._async_ensure_metrics_session()
+        return await self._async_fetch_metrics(
+            plant_id,
+            int(datetime.now(UTC).timestamp() * 1000),
+            str(_timezone_offset_hours()),
+        )
+
+    def _get_cached_metrics(self, plant_id: str) -> PlantSnapshot | None:
+        """Return a cached snapshot that is still within the TTL."""
+        cached = self._metrics_cache.get(plant_id)
+        if cached is None or time.monotonic() - cached[0] >= self._metrics_cache_ttl:
+            return None
+        self._metrics_cache.move_to_end(plant_id)
+        return cached[1]
+
+    async def _async_ensure_metrics_session(self) -> None:
+        """Make sure a session and roarand token exist before KPI requests."""
         if not self._session_valid:
             await self.async_refresh_session()
         elif not self._roarand_token:
             await self._async_refresh_roarand_token()
 
-        now_ms = int(datetime.now(UTC).timestamp() * 1000)
+    async def _async_fetch_metrics(
+        self,
+        plant_id: str,
+        now_ms: int,
+        time_zone: str,
+    ) -> PlantSnapshot:
+        """Request and parse the real-time KPI payload for one plant."""
         params = {
             "stationDn": plant_id,
             "clientTime": str(now_ms),
-            "timeZone": str(_timezone_offset_hours()),
+            "timeZone": time_zone,
             "_": str(now_ms),
         }
 
@@ -470,31 +652,18 @@ class FusionSolarApiClient:
             params=params,
         )
 
-        combined = response.payload
-        power_w = _parse_power_w(combined)
-        today_kwh = _parse_energy(combined, ENERGY_TODAY_KEYS)
-        month_kwh = _parse_energy(combined, ENERGY_MONTH_KEYS)
-        year_kwh = _parse_energy(combined, ENERGY_YEAR_KEYS)
-        total_kwh = _parse_energy(combined, ENERGY_TOTAL_KEYS)
-
-        if None in (power_w, today_kwh, month_kwh, year_kwh, total_kwh):
-            raise EndpointSchemaChanged(
-                f"Unable to parse metrics for plant_id={plant_id}"
-            )
-
-        return PlantSnapshot(
-            plant_id=plant_id,
-            plant_name=_extract_plant_name(combined)
-            or self._plant_names.get(plant_id)
-            or plant_id,
-            power_w=power_w,
-            energy_today_kwh=today_kwh,
-            energy_month_kwh=month_kwh,
-            energy_year_kwh=year_kwh,
-            energy_total_kwh=total_kwh,
-            updated_at_utc=datetime.now(UTC),
+        snapshot = _parse_snapshot(
+            plant_id,
+            response.payload,
+            self._plant_names.get(plant_id) or plant_id,
         )
 
+        self._metrics_cache[plant_id] = (time.monotonic(), snapshot)
+        self._metrics_cache.move_to_end(plant_id)
+        if len(self._metrics_cache) > METRICS_CACHE_MAX_ENTRIES:
+            self._metrics_cache.popitem(last=False)
+        return snapshot
+
     def get_debug_state(self) -> dict[str, Any]:
         """Return diagnostics-safe state."""
         return {
@@ -506,7 +675,14 @@ class FusionSolarApiClient:
             "roarand_token_present": bool(self._roarand_token),
             "username_masked": _mask_username(self._username),
             "known_plants": self._plant_names,
-            "recent_statuses": list(self._recent_statuses),
+            "recent_statuses": [
+                {
+                    "endpoint": endpoint,
+                    "status": status,
+                    "at_utc": datetime.fromtimestamp(at, UTC).isoformat(),
+                }
+                for endpoint, status, at in self._recent_statuses
+            ],
         }
 
     async def _request_raw(
@@ -522,97 +698,105 @@ class FusionSolarApiClient:
     ) -> _RawResponse:
         """Perform one HTTP request and parse JSON when available."""
         request_host = host or self._effective_host
-        url_obj = URL.build(scheme="https", host=request_host, path=endpoint)
+        url = URL.build(scheme="https", host=request_host, path=endpoint)
         if params:
-            url_obj = url_obj.update_query(params)
+            url = url.update_query(params)
 
         headers = self._build_headers(endpoint, extra_headers, request_host)
+        raw = await self._request_once(method, endpoint, url, headers, json_data)
+
+        if (
+            raw.status in (401, 403)
+            and allow_auth_retry
+            and endpoint not in AUTH_RETRY_EXCLUDED_ENDPOINTS
+            and self._username
+            and self._password
+        ):
+            await self.async_refresh_session()
+            headers = self._build_headers(endpoint, extra_headers, request_host)
+            raw = await self._request_once(method, endpoint, url, headers, json_data)
 
-        for attempt in range(2):
-            try:
-                response_ctx = self._session.request(
-                    method,
-                    str(url_obj),
-                    json=json_data,
-                    headers=headers,
-                    allow_redirects=True,
-                    timeout=aiohttp.ClientTimeout(total=self._timeout_seconds),
-                    ssl=self._verify_ssl,
-                )
-                async with response_ctx as response:
-                    payload = await _decode_payload(response)
-                    raw = _RawResponse(
-                        status=response.status,
-                        payload=payload,
-                        url=response.url,
-                        headers={k.lower(): v for k, v in response.headers.items()},
-                    )
-            except TimeoutError as err:
-                raise CannotConnect("Connection timeout") from err
-            except aiohttp.ClientError as err:
-                raise CannotConnect("Client error") from err
-
-            self._record_status(endpoint, raw.status)
-            self._apply_runtime_from_response(raw)
-            self._extract_security_tokens(raw)
-
-            if raw.status in (401, 403):
-                self._session_valid = False
-                self._roarand_token = None
-                if (
-                    allow_auth_retry
-                    and attempt == 0
-                    and endpoint
-                    not in {
-                        VALIDATE_USER_PATH,
-                        SSO_READY_PATH,
-                        LOGIN_REDIRECT_PATH,
-                    }
-                    and self._username
-                    and self._password
-                ):
-                    await self.async_refresh_session()
-                    headers = self._build_headers(endpoint, extra_headers, request_host)
-                    continue
-                raise InvalidAuth("Unauthorized")
-
-            if raw.status == 429:
-                raise RateLimited("FusionSolar rate limit reached")
-
-            if raw.status >= 500:
-                raise CannotConnect(f"FusionSolar server error: {raw.status}")
-
-            if raw.status >= 400:
-                if endpoint == VALIDATE_USER_PATH:
-                    raise InvalidAuth("Invalid username or password")
-                raise CannotConnect(f"FusionSolar request failed: HTTP {raw.status}")
-
-            content_type = raw.headers.get("content-type", "")
-            if (
-                raw.status == 200
-                and endpoint.startswith("/rest/")
-                and endpoint != LOGIN_REDIRECT_PATH
-                and "text/html" in content_type
-            ):
-                if endpoint == VALIDATE_USER_PATH:
-                    raise CannotConnect(
-                        "FusionSolar returned HTML challenge page before login"
-                    )
-                raise InvalidAuth("Session invalid (received HTML on REST endpoint)")
+        return self._check_response(endpoint, raw)
 
-            return raw
+    async def _request_once(
+        self,
+        method: str,
+        endpoint: str,
+        url: URL,
+        headers: dict[str, str],
+        json_data: dict[str, Any] | None,
+    ) -> _RawResponse:
+        """Send a single request and record its side effects on the client."""
+        try:
+            response_ctx = self._session.request(
+                method,
+                url,
+                json=json_data,
+                headers=headers,
+                allow_redirects=True,
+                timeout=self._client_timeout,
+                ssl=self._verify_ssl,
+            )
+            async with response_ctx as response:
+                payload = await _decode_payload(response)
+                raw = _RawResponse(
+                    status=response.status,
+                    payload=payload,
+                    url=response.url,
+                    headers=response.headers,
+                )
+        except TimeoutError as err:
+            raise CannotConnect("Connection timeout") from err
+        except aiohttp.ClientError as err:
+            raise CannotConnect("Client error") from err
+
+        self._record_status(endpoint, raw.status)
+        self._apply_runtime_from_response(raw)
+        self._extract_security_tokens(endpoint, raw)
+
+        if raw.status in (401, 403):
+            self._session_valid = False
+            self._roarand_token = None
+        return raw
+
+    def _check_response(self, endpoint: str, raw: _RawResponse) -> _RawResponse:
+        """Map HTTP status and content type to API errors."""
+        if raw.status in (401, 403):
+            raise InvalidAuth("Unauthorized")
+
+        if raw.status == 429:
+            raise RateLimited("FusionSolar rate limit reached")
+
+        if raw.status >= 500:
+            raise CannotConnect(f"FusionSolar server error: {raw.status}")
+
+        if raw.status >= 400:
+            if endpoint == VALIDATE_USER_PATH:
+                raise InvalidAuth("Invalid username or password")
+            raise CannotConnect(f"FusionSolar request failed: HTTP {raw.status}")
+
+        content_type = raw.headers.get("content-type", "")
+        if (
+            raw.status == 200
+            and endpoint.startswith("/rest/")
+            and endpoint != LOGIN_REDIRECT_PATH
+            and "text/html" in content_type
+        ):
+            if endpoint == VALIDATE_USER_PATH:
+                raise CannotConnect(
+                    "FusionSolar returned HTML challenge page before login"
+                )
+            raise InvalidAuth("Session invalid (received HTML on REST endpoint)")
 
-        raise CannotConnect("Request retry exhausted")
+        # Only authenticated endpoints prove the session; pre-login probes
+        # succeed without one.
+        if endpoint == KEEPALIVE_PATH or endpoint.startswith(STATION_PATH_PREFIX):
+            self._last_ok_at = time.monotonic()
+        return raw
 
     def _record_status(self, endpoint: str, status: int) -> None:
         """Keep compact recent status history for diagnostics."""
-        self._recent_statuses.append(
-            {
-                "endpoint": endpoint,
-                "status": status,
-                "at_utc": datetime.now(UTC).isoformat(),
-            }
-        )
+        self._recent_statuses.append((endpoint, status, time.time()))
 
     def _build_headers(
         self,
@@ -621,27 +805,21 @@ class FusionSolarApiClient:
         host: str,
     ) -> dict[str, str]:
         """Build request headers."""
-        headers = {
-            "Accept": "application/json, text/javascript, */*; q=0.01",
-            "X-Requested-With": "XMLHttpRequest",
-            "User-Agent": BROWSER_USER_AGENT,
-            "Accept-Language": "en-US,en;q=0.9",
-        }
+        headers = self._base_headers.copy()
 
-        if endpoint.startswith("/rest/pvms/web/station/"):
+        if endpoint.startswith(STATION_PATH_PREFIX):
             headers["x-non-renewal-session"] = "true"
             headers["x-timezone-offset"] = str(_timezone_offset_minutes())
             headers["roarand"] = self._roarand_token or _build_roarand_token()
 
-        if endpoint in {
-            VALIDATE_USER_PATH,
-            SSO_READY_PATH,
-            LOGIN_REDIRECT_PATH,
-            VERIFY_CODE_CHECK_PATH,
-            LIST_UNFORBIDDEN_SERVER_PATH,
-        }:
-            headers["Origin"] = f"https://{host}"
-            headers["Referer"] = f"https://{host}{LOGIN_PAGE_PATH}"
+        if endpoint in LOGIN_ENDPOINTS:
+            host_headers = self._host_headers.get(host)
+            if host_headers is None:
+                host_headers = self._host_headers[host] = {
+                    "Origin": f"https://{host}",
+                    "Referer": f"https://{host}{LOGIN_PAGE_PATH}",
+                }
+            headers.update(host_headers)
 
         if self._csrf_token:
             headers["X-CSRF-Token"] = self._csrf_token
@@ -656,42 +834,49 @@ class FusionSolarApiClient:
         if response.url.host:
             self._effective_host = response.url.host
 
-    def _extract_security_tokens(self, response: _RawResponse) -> None:
-        """Persist CSRF-like tokens when present in payload/headers."""
+    def _extract_security_tokens(self, endpoint: str, response: _RawResponse) -> None:
+        """Persist CSRF-like tokens when present in payload/headers.
+
+        Only login responses get a full payload walk; routine polling
+        responses are checked at the top level and known containers.
+        """
         header_token = response.headers.get("x-csrf-token")
         if header_token:
             self._csrf_token = header_token
             return
 
         payload = response.payload
-        token = _find_string(payload, CSRF_KEYS)
+        if endpoint in LOGIN_ENDPOINTS:
+            token = _find_string(payload, CSRF_KEYS)
+        else:
+            token = _find_shallow_string(payload, CSRF_KEYS)
         if token:
             self._csrf_token = token
 
 
+@lru_cache(maxsize=32)
 def _sanitize_host(host: str) -> str:
     host = host.strip().lower()
     return host.replace("https://", "").replace("http://", "").rstrip("/")
 
 
-def _dedupe(values: Iterable[str | None]) -> list[str]:
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for value in values:
-        if not value:
-            continue
-        if value in seen:
-            continue
-        seen.add(value)
-        deduped.append(value)
-    return deduped
+# Local UTC offsets only change on DST transitions, which always land on a
+# quarter-hour boundary, so the offset can be reused within one bucket.
+TZ_OFFSET_BUCKET_SECONDS = 900
+
+_tz_offset_cache: tuple[int, int] = (-1, 0)
+_local_midnight_cache: tuple[float, int] = (0.0, 0)
 
 
 def _timezone_offset_minutes() -> int:
+    global _tz_offset_cache
+    bucket = int(time.time()) // TZ_OFFSET_BUCKET_SECONDS
+    if _tz_offset_cache[0] == bucket:
+        return _tz_offset_cache[1]
     offset = datetime.now().astimezone().utcoffset()
-    if offset is None:
-        return 0
-    return int(offset.total_seconds() // 60)
+    minutes = 0 if offset is None else int(offset.total_seconds() // 60)
+    _tz_offset_cache = (bucket, minutes)
+    return minutes
 
 
 def _timezone_offset_hours() -> int | float:
@@ -703,9 +888,17 @@ def _timezone_offset_hours() -> int | float:
 
 
 def _local_midnight_epoch_ms() -> int:
-    now_local = datetime.now().astimezone()
-    midnight_local = now_local.replace(hour=0, minute=0, second=0, microsecond=0)
-    return int(midnight_local.timestamp() * 1000)
+    global _local_midnight_cache
+    now = time.time()
+    valid_until, midnight_ms = _local_midnight_cache
+    if now < valid_until and midnight_ms:
+        return midnight_ms
+    today = date.fromtimestamp(now)
+    midnight = datetime.combine(today, dt_time.min).timestamp()
+    next_midnight = datetime.combine(today + timedelta(days=1), dt_time.min).timestamp()
+    midnight_ms = int(midnight * 1000)
+    _local_midnight_cache = (next_midnight, midnight_ms)
+    return midnight_ms
 
 
 def _station_list_payload() -> dict[str, Any]:
@@ -744,11 +937,8 @@ def _payload_indicates_invalid_auth(payload: Any) -> bool:
     if code is not None and str(code) in LOGIN_ERROR_CODES:
         return True
 
-    msg = str(payload.get("message") or payload.get("msg") or "").lower()
-    if "password" in msg and ("wrong" in msg or "invalid" in msg or "error" in msg):
-        return True
-
-    return False
+    msg = str(payload.get("message") or payload.get("msg") or "")
+    return _LOGIN_ERROR_MESSAGE_RE.search(msg) is not None
 
 
 def _payload_requires_verify_code(payload: Any) -> bool:
@@ -772,7 +962,10 @@ def _extract_keepalive_token(payload: Any) -> str | None:
     return None
 
 
-def _extract_login_ticket(payload: Any, headers: dict[str, str]) -> str | None:
+def _extract_login_ticket(
+    payload: Any,
+    headers: CIMultiDictProxy[str],
+) -> str | None:
     """Extract SSO ticket from login payload or response headers."""
     if isinstance(payload, dict):
         data = payload.get("payload")
@@ -801,17 +994,16 @@ def _extract_ticket_from_url(url: str | None) -> str | None:
 
 
 async def _decode_payload(response: aiohttp.ClientResponse) -> Any:
-    """Decode JSON payload; fallback to text and best-effort JSON parsing."""
+    """Decode JSON payload; fall back to the raw text body."""
     try:
-        return await response.json(content_type=None)
+        return await response.json(loads=_json_loads, content_type=None)
     except (aiohttp.ContentTypeError, json.JSONDecodeError):
+        # The body was already read and rejected by the JSON parser, so
+        # parsing the text again cannot succeed.
         body = await response.text()
         if not body:
             return {}
-        try:
-            return json.loads(body)
-        except json.JSONDecodeError:
-            return {"raw": body}
+        return {"raw": body}
 
 
 def _parse_station_list(payload: Any) -> list[PlantInfo]:
@@ -827,6 +1019,9 @@ def _parse_station_list(payload: Any) -> list[PlantInfo]:
             plant_id = _to_str(_find_value_by_keys(entry, PLANT_ID_KEYS))
             if not plant_id:
                 continue
+            # Interned ids from every poll are the same objects entities keep,
+            # so dict lookups hit the identity fast path.
+            plant_id = sys.intern(plant_id)
             plant_name = _to_str(_find_value_by_keys(entry, PLANT_NAME_KEYS)) or plant_id
             plants.append(PlantInfo(plant_id=plant_id, plant_name=plant_name))
 
@@ -838,32 +1033,35 @@ def _parse_station_list(payload: Any) -> list[PlantInfo]:
 
 
 def _parse_plants_fallback(payload: Any) -> list[PlantInfo]:
-    entries = _walk_payload_entries(payload)
     plants: dict[str, PlantInfo] = {}
 
-    for entry in entries:
+    # Later (deeper) entries overwrite earlier ones, so each plant ends up with
+    # the name stored next to its own id.
+    for entry in _iter_payload_entries(payload):
         plant_id_value = _find_value_by_keys(entry, PLANT_ID_KEYS)
         plant_name_value = _find_value_by_keys(entry, PLANT_NAME_KEYS)
         plant_id = _to_str(plant_id_value)
         if not plant_id:
             continue
+        plant_id = sys.intern(plant_id)
         plant_name = _to_str(plant_name_value) or plant_id
         plants[plant_id] = PlantInfo(plant_id=plant_id, plant_name=plant_name)
 
     return list(plants.values())
 
 
-def _walk_payload_entries(payload: Any) -> list[dict[str, Any]]:
-    """Return all dictionary entries nested in payload."""
-    entries: list[dict[str, Any]] = []
-    if isinstance(payload, dict):
-        entries.append(payload)
-        for value in payload.values():
-            entries.extend(_walk_payload_entries(value))
-    elif isinstance(payload, list):
-        for item in payload:
-            entries.extend(_walk_payload_entries(item))
-    return entries
+def _iter_payload_entries(payload: Any) -> Iterator[dict[str, Any]]:
+    """Yield all dictionary entries nested in payload, breadth-first."""
+    queue: deque[Any] = deque([payload])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            yield node
+            queue.extend(
+                value for value in node.values() if isinstance(value, (dict, list))
+            )
+        elif isinstance(node, list):
+            queue.extend(item for item in node if isinstance(item, (dict, list)))
 
 
 def _extract_data(payload: Any) -> Any:
@@ -872,23 +1070,50 @@ def _extract_data(payload: Any) -> Any:
     return payload
 
 
-def _extract_plant_name(payload: Any) -> str | None:
-    data = _extract_data(payload)
-    value = _find_value_by_keys(data, PLANT_NAME_KEYS)
-    return _to_str(value) or None
-
-
-def _parse_power_w(payload: Any) -> float | None:
-    data = _extract_data(payload)
-    raw_value, key = _find_numeric_value(data, POWER_KEYS)
+def _parse_snapshot(plant_id: str, payload: Any, fallback_name: str) -> PlantSnapshot:
+    """Build a snapshot from a KPI payload in a single walk of the tree."""
+    found = _collect_keys(
+        _extract_data(payload),
+        METRIC_KEY_INDEX,
+        len(METRIC_KEY_GROUPS),
+    )
+    power_w = _parse_power_w(found)
+    today_kwh = _found_float(found, "today")
+    month_kwh = _found_float(found, "month")
+    year_kwh = _found_float(found, "year")
+    total_kwh = _found_float(found, "total")
+
+    if None in (power_w, today_kwh, month_kwh, year_kwh, total_kwh):
+        raise EndpointSchemaChanged(f"Unable to parse metrics for plant_id={plant_id}")
+
+    name = found.get("name")
+    return PlantSnapshot(
+        plant_id=plant_id,
+        plant_name=(_to_str(name[0]) if name else "") or fallback_name,
+        power_w=power_w,
+        energy_today_kwh=today_kwh,
+        energy_month_kwh=month_kwh,
+        energy_year_kwh=year_kwh,
+        energy_total_kwh=total_kwh,
+        updated_at_utc=datetime.now(UTC),
+    )
+
+
+def _parse_power_w(found: dict[str, tuple[Any, str]]) -> float | None:
+    """Return power in W, scaling by the reported unit or key convention."""
+    power = found.get("power")
+    if power is None:
+        return None
+    raw, key = power
+    raw_value = _to_float(raw)
     if raw_value is None:
         return None
 
-    unit_value = _find_value_by_keys(data, POWER_UNIT_KEYS)
-    unit = _to_str(unit_value).lower()
-    key_lower = key.lower() if key else ""
+    unit_entry = found.get("unit")
+    unit = _to_str(unit_entry[0]).lower() if unit_entry else ""
+    key_lower = key.lower()
 
-    if unit == "kw" or key_lower in {"currentpower", "inverterpower"}:
+    if unit == "kw" or key_lower in KW_POWER_KEYS:
         return raw_value * 1000
     if unit == "mw":
         return raw_value * 1_000_000
@@ -896,76 +1121,109 @@ def _parse_power_w(payload: Any) -> float | None:
         return raw_value
 
     # KPI endpoint uses kW for currentPower.
-    if key_lower in {"currentpower", "activepower", "realtimepower", "power", "pac"}:
+    if key_lower in POWER_KEYS:
         if abs(raw_value) < 1000:
             return raw_value * 1000
 
     return raw_value
 
 
-def _parse_energy(payload: Any, candidate_keys: tuple[str, ...]) -> float | None:
-    data = _extract_data(payload)
-    value, _ = _find_numeric_value(data, candidate_keys)
-    return value
+def _found_float(found: dict[str, tuple[Any, str]], group: str) -> float | None:
+    if group not in found:
+        return None
+    return _to_float(found[group][0])
 
 
-def _find_string(payload: Any, candidate_keys: tuple[str, ...]) -> str | None:
+def _find_string(payload: Any, candidate_keys: frozenset[str]) -> str | None:
     value = _find_value_by_keys(payload, candidate_keys)
     converted = _to_str(value)
     return converted or None
 
 
-def _find_numeric_value(payload: Any, candidate_keys: tuple[str, ...]) -> tuple[float | None, str | None]:
-    found = _find_value_by_keys(payload, candidate_keys, with_key=True)
-    if found is None:
-        return None, None
-    value, key = found
-    return _to_float(value), key
+def _find_shallow_string(
+    payload: Any, candidate_keys: frozenset[str]
+) -> str | None:
+    """Look for a candidate key at the top level or one container deep."""
+    if not isinstance(payload, dict):
+        return None
+    for node in (payload, *(payload.get(key) for key in SHALLOW_CONTAINER_KEYS)):
+        if not isinstance(node, dict):
+            continue
+        for key, value in node.items():
+            if key.lower() in candidate_keys and value not in (None, ""):
+                return _to_str(value) or None
+    return None
 
 
-def _find_value_by_keys(
-    payload: Any,
-    candidate_keys: tuple[str, ...],
-    *,
-    with_key: bool = False,
-) -> Any:
-    key_lookup = {key.lower() for key in candidate_keys}
+def _find_value_by_keys(payload: Any, candidate_keys: frozenset[str]) -> Any:
+    """Return the first non-empty value whose lowercase key is a candidate."""
+    queue: deque[Any] = deque([payload])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key.lower() in candidate_keys and value not in (None, ""):
+                    return value
+            queue.extend(
+                value for value in node.values() if isinstance(value, (dict, list))
+            )
+        elif isinstance(node, list):
+            queue.extend(item for item in node if isinstance(item, (dict, list)))
+    return None
 
-    if isinstance(payload, dict):
-        for key, value in payload.items():
-            if key.lower() in key_lookup and value not in (None, ""):
-                return (value, key) if with_key else value
-        for value in payload.values():
-            found = _find_value_by_keys(value, candidate_keys, with_key=with_key)
-            if found is not None:
-                return found
-    elif isinstance(payload, list):
-        for item in payload:
-            found = _find_value_by_keys(item, candidate_keys, with_key=with_key)
-            if found is not None:
-                return found
 
-    return None
+def _collect_keys(
+    payload: Any,
+    key_index: dict[str, tuple[str, ...]],
+    group_count: int,
+) -> dict[str, tuple[Any, str]]:
+    """Find the first non-empty value for every key group in one BFS pass.
+
+    ``key_index`` maps lowercase payload keys to the groups they fill.
+    Returns ``{group: (value, original_key)}`` for the groups that were found.
+    """
+    found: dict[str, tuple[Any, str]] = {}
+    queue: deque[Any] = deque([payload])
+    while queue and len(found) < group_count:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                groups = key_index.get(key.lower())
+                if groups and value not in (None, ""):
+                    for group in groups:
+                        if group not in found:
+                            found[group] = (value, key)
+                if isinstance(value, (dict, list)):
+                    queue.append(value)
+        elif isinstance(node, list):
+            queue.extend(item for item in node if isinstance(item, (dict, list)))
+    return found
 
 
 def _to_float(value: Any) -> float | None:
+    # JSON numbers are the common case; test exact types before anything else.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
     if value is None:
         return None
 
-    if isinstance(value, (int, float)):
-        return float(value)
-
-    if isinstance(value, str):
-        text = value.strip().replace(",", ".")
-        if not text:
-            return None
-        if text == "--":
+    if value_type is str:
+        text = value.strip()
+        if "," in text:
+            text = text.replace(",", ".")
+        if not text or text == "--":
             return None
         try:
             return float(text)
         except ValueError:
             return None
 
+    if isinstance(value, (int, float)):
+        return float(value)
+
     return None
 
 
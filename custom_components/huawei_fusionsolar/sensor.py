@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Final
 
 from homeassistant.components.sensor import (
@@ -14,10 +15,9 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfEnergy, UnitOfPower
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import FusionSolarRuntimeData
 from .const import DOMAIN
@@ -39,7 +39,7 @@ SENSOR_DESCRIPTIONS: Final[tuple[FusionSolarSensorDescription, ...]] = (
         device_class=SensorDeviceClass.POWER,
         native_unit_of_measurement=UnitOfPower.WATT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda snapshot: snapshot.power_w,
+        value_fn=attrgetter("power_w"),
     ),
     FusionSolarSensorDescription(
         key="energy_today_kwh",
@@ -47,7 +47,7 @@ SENSOR_DESCRIPTIONS: Final[tuple[FusionSolarSensorDescription, ...]] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda snapshot: snapshot.energy_today_kwh,
+        value_fn=attrgetter("energy_today_kwh"),
     ),
     FusionSolarSensorDescription(
         key="energy_month_kwh",
@@ -55,7 +55,7 @@ SENSOR_DESCRIPTIONS: Final[tuple[FusionSolarSensorDescription, ...]] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda snapshot: snapshot.energy_month_kwh,
+        value_fn=attrgetter("energy_month_kwh"),
     ),
     FusionSolarSensorDescription(
         key="energy_year_kwh",
@@ -63,7 +63,7 @@ SENSOR_DESCRIPTIONS: Final[tuple[FusionSolarSensorDescription, ...]] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda snapshot: snapshot.energy_year_kwh,
+        value_fn=attrgetter("energy_year_kwh"),
     ),
     FusionSolarSensorDescription(
         key="energy_total_kwh",
@@ -71,7 +71,7 @@ SENSOR_DESCRIPTIONS: Final[tuple[FusionSolarSensorDescription, ...]] = (
         device_class=SensorDeviceClass.ENERGY,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda snapshot: snapshot.energy_total_kwh,
+        value_fn=attrgetter("energy_total_kwh"),
     ),
 )
 
@@ -85,25 +85,23 @@ async def async_setup_entry(
     runtime: FusionSolarRuntimeData = hass.data[DOMAIN][entry.entry_id]
     coordinator = runtime.coordinator
 
-    entities: dict[str, FusionSolarSensor] = {}
+    hubs: dict[str, _PlantHub] = {}
 
     def _collect_new_entities() -> list[FusionSolarSensor]:
-        new_entities: list[FusionSolarSensor] = []
-        for plant_id in coordinator.data:
-            for description in SENSOR_DESCRIPTIONS:
-                unique_id = f"{plant_id}_{description.key}"
-                if unique_id in entities:
-                    continue
-
-                entity = FusionSolarSensor(
-                    coordinator=coordinator,
-                    plant_id=plant_id,
-                    description=description,
-                )
-                entities[unique_id] = entity
-                new_entities.append(entity)
-
-        return new_entities
+        if hubs.keys() >= coordinator.data.keys():
+            return []
+
+        new_hubs = [
+            _PlantHub(coordinator, plant_id)
+            for plant_id in coordinator.data
+            if plant_id not in hubs
+        ]
+        hubs.update((hub.plant_id, hub) for hub in new_hubs)
+        return [
+            FusionSolarSensor(hub, description)
+            for hub in new_hubs
+            for description in SENSOR_DESCRIPTIONS
+        ]
 
     initial_entities = _collect_new_entities()
     if initial_entities:
@@ -118,30 +116,109 @@ async def async_setup_entry(
     entry.async_on_unload(coordinator.async_add_listener(_async_add_new_entities))
 
 
-class FusionSolarSensor(
-    CoordinatorEntity[FusionSolarDataUpdateCoordinator],
-    SensorEntity,
-):
+class _PlantHub:
+    """Fan one coordinator listener out to all sensors of a plant."""
+
+    __slots__ = (
+        "coordinator",
+        "plant_id",
+        "snapshot",
+        "last_update_success",
+        "device_info",
+        "_sensors",
+        "_unsub",
+    )
+
+    def __init__(
+        self,
+        coordinator: FusionSolarDataUpdateCoordinator,
+        plant_id: str,
+    ) -> None:
+        self.coordinator = coordinator
+        self.plant_id = plant_id
+        self.snapshot: PlantSnapshot | None = coordinator.data.get(plant_id)
+        self.last_update_success = coordinator.last_update_success
+        # Shared by all sensors of the plant; only read at entity registration.
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, plant_id)},
+            manufacturer="Huawei",
+            model="FusionSolar",
+            name=(
+                self.snapshot.plant_name
+                if self.snapshot
+                else coordinator.known_plants.get(plant_id, plant_id)
+            ),
+        )
+        self._sensors: list[FusionSolarSensor] = []
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_sensor(self, sensor: FusionSolarSensor) -> CALLBACK_TYPE:
+        """Register a sensor, subscribing to the coordinator on first use."""
+        self._sensors.append(sensor)
+        if self._unsub is None:
+            # Updates were missed while no sensor listened; catch up first.
+            self.snapshot = self.coordinator.data.get(self.plant_id)
+            self.last_update_success = self.coordinator.last_update_success
+            self._unsub = self.coordinator.async_add_listener(
+                self._handle_coordinator_update
+            )
+
+        @callback
+        def _remove_sensor() -> None:
+            self._sensors.remove(sensor)
+            if not self._sensors and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _remove_sensor
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the plant snapshot and write state only when it changed."""
+        snapshot = self.coordinator.data.get(self.plant_id)
+        last_update_success = self.coordinator.last_update_success
+        if (
+            snapshot == self.snapshot
+            and last_update_success == self.last_update_success
+        ):
+            return
+        self.snapshot = snapshot
+        self.last_update_success = last_update_success
+        for sensor in self._sensors:
+            sensor.async_write_ha_state()
+
+
+class FusionSolarSensor(SensorEntity):
     """Representation of a FusionSolar sensor."""
 
     entity_description: FusionSolarSensorDescription
     _attr_has_entity_name = True
+    _attr_should_poll = False
 
     def __init__(
         self,
-        coordinator: FusionSolarDataUpdateCoordinator,
-        plant_id: str,
+        hub: _PlantHub,
         description: FusionSolarSensorDescription,
     ) -> None:
-        super().__init__(coordinator)
-        self._plant_id = plant_id
+        self._hub = hub
         self.entity_description = description
-        self._attr_unique_id = f"{plant_id}_{description.key}"
+        self._attr_unique_id = f"{hub.plant_id}_{description.key}"
+        self._attr_device_info = hub.device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to updates through the plant hub."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._hub.async_add_sensor(self))
+
+    async def async_update(self) -> None:
+        """Request a coordinator refresh (used by homeassistant.update_entity)."""
+        await self._hub.coordinator.async_request_refresh()
 
     @property
     def native_value(self) -> float | None:
         """Return native value for this sensor."""
-        snapshot = self.coordinator.data.get(self._plant_id)
+        snapshot = self._hub.snapshot
         if not snapshot:
             return None
         return self.entity_description.value_fn(snapshot)
@@ -149,21 +226,4 @@ class FusionSolarSensor(
     @property
     def available(self) -> bool:
         """Return availability based on coordinator data."""
-        return super().available and self._plant_id in self.coordinator.data
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return metadata for plant device."""
-        snapshot = self.coordinator.data.get(self._plant_id)
-        plant_name = (
-            snapshot.plant_name
-            if snapshot
-            else self.coordinator.known_plants.get(self._plant_id, self._plant_id)
-        )
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._plant_id)},
-            manufacturer="Huawei",
-            model="FusionSolar",
-            name=plant_name,
-        )
+        return self._hub.last_update_success and self._hub.snapshot is not None
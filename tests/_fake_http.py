@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 import json
+import sys
+from types import MappingProxyType
 from typing import Any
 
+from multidict import CIMultiDict, CIMultiDictProxy
 from yarl import URL
 
 
-@dataclass(slots=True)
+@lru_cache(maxsize=256)
+def _url_path(url: str | URL) -> str:
+    return sys.intern(URL(url).path)
+
+
+@dataclass(slots=True, frozen=True)
 class StubResponse:
     """Stubbed HTTP response payload."""
 
@@ -23,26 +33,34 @@ class StubResponse:
 class FakeClientResponse:
     """Subset of aiohttp.ClientResponse used by the API client."""
 
+    __slots__ = ("status", "_payload", "_text", "url", "headers")
+
     def __init__(self, stub: StubResponse) -> None:
         self.status = stub.status
         self._payload = stub.payload
+        self._text = stub.payload if isinstance(stub.payload, str) else None
         self.url = URL(stub.url)
-        self.headers = stub.headers or {}
+        self.headers = CIMultiDictProxy(CIMultiDict(stub.headers or {}))
 
-    async def json(self, content_type: str | None = None) -> Any:
+    async def json(self, *, loads: Any = json.loads, content_type: str | None = None) -> Any:
         if isinstance(self._payload, Exception):
             raise self._payload
         return self._payload
 
     async def text(self) -> str:
-        if isinstance(self._payload, (dict, list)):
-            return json.dumps(self._payload)
-        return str(self._payload)
+        if self._text is None:
+            if isinstance(self._payload, (dict, list)):
+                self._text = json.dumps(self._payload)
+            else:
+                self._text = str(self._payload)
+        return self._text
 
 
 class _FakeContextManager:
     """Async context manager wrapper around fake response."""
 
+    __slots__ = ("_response",)
+
     def __init__(self, response: FakeClientResponse) -> None:
         self._response = response
 
@@ -56,20 +74,125 @@ class _FakeContextManager:
 class FakeClientSession:
     """Minimal request dispatcher compatible with aiohttp.ClientSession."""
 
-    def __init__(self, routes: dict[tuple[str, str], list[StubResponse]]) -> None:
-        self._routes = defaultdict(list)
-        for key, responses in routes.items():
-            self._routes[(key[0].upper(), key[1])] = list(responses)
+    def __init__(
+        self,
+        routes: Mapping[tuple[str, str], Sequence[StubResponse]],
+    ) -> None:
+        self._routes: defaultdict[str, dict[str, deque[StubResponse]]] = defaultdict(
+            dict
+        )
+        for (method, path), responses in routes.items():
+            self._routes[method.upper()][sys.intern(path)] = deque(responses)
         self.calls: list[tuple[str, str]] = []
 
-    def request(self, method: str, url: str, **kwargs: Any) -> _FakeContextManager:
+    def request(self, method: str, url: str | URL, **kwargs: Any) -> _FakeContextManager:
         method = method.upper()
-        path = URL(url).path
+        path = _url_path(url)
         key = (method, path)
         self.calls.append(key)
 
-        if key not in self._routes or not self._routes[key]:
+        by_method = self._routes.get(method)
+        queue = by_method.get(path) if by_method else None
+        if not queue:
             raise AssertionError(f"Unexpected request: {key}")
 
-        stub = self._routes[key].pop(0)
+        stub = queue.popleft()
         return _FakeContextManager(FakeClientResponse(stub))
+
+
+# (method, path, payload, headers) for each best-effort pre-login probe.
+_PRELOGIN_SHAPE: tuple[tuple[str, str, Any, dict[str, str] | None], ...] = (
+    (
+        "GET",
+        "/pvmswebsite/login/build/index.html",
+        {"raw": "<html></html>"},
+        {"content-type": "text/html; charset=UTF-8"},
+    ),
+    ("GET", "/rest/pvms/web/security/v1/language", {"success": True}, None),
+    ("GET", "/rest/dp/pvms/pvmswebsite/v1/deployment", {"success": True}, None),
+    (
+        "GET",
+        "/rest/dp/uidm/unisso/v1/is-check-verify-code",
+        {"code": 0, "payload": {"verifyCodeCreate": False}},
+        None,
+    ),
+    (
+        "POST",
+        "/rest/pvms/web/server/v1/servermgmt/list-unforbidden-server",
+        {"success": True},
+        None,
+    ),
+    (
+        "GET",
+        "/rest/dpcloud/auth/v1/keep-alive",
+        {"code": 0, "payload": "c-test-roarand"},
+        None,
+    ),
+)
+
+
+@lru_cache(maxsize=4)
+def prelogin_routes(host: str) -> Mapping[tuple[str, str], Sequence[StubResponse]]:
+    """Return shared read-only routes for the pre-login probes and keep-alive.
+
+    Each route answers three times. FakeClientSession copies each response
+    sequence, so the cached routes can be reused by every test.
+    """
+    return MappingProxyType(
+        {
+            (method, path): (
+                StubResponse(
+                    status=200,
+                    payload=payload,
+                    url=f"https://{host}{path}",
+                    headers=headers,
+                ),
+            )
+            * 3
+            for method, path, payload, headers in _PRELOGIN_SHAPE
+        }
+    )
+
+
+def sso_routes(
+    host: str,
+    validate_user_payload: dict[str, Any],
+    *,
+    logins: int = 1,
+) -> dict[tuple[str, str], Sequence[StubResponse]]:
+    """Return pre-login routes plus ``logins`` validate-user -> SSO redirect flows.
+
+    The shared pre-login routes answer three times, enough for up to three
+    logins.
+    """
+    return {
+        **prelogin_routes(host),
+        ("POST", "/rest/dp/uidm/unisso/v1/validate-user"): [
+            StubResponse(
+                status=200,
+                payload=validate_user_payload,
+                url=f"https://{host}/rest/dp/uidm/unisso/v1/validate-user",
+            )
+        ]
+        * logins,
+        ("GET", "/rest/dp/uidm/auth/v1/on-sso-credential-ready"): [
+            StubResponse(
+                status=302,
+                payload={},
+                url=f"https://{host}/rest/dp/uidm/auth/v1/on-sso-credential-ready",
+                headers={
+                    "location": f"https://{host}/rest/pvms/web/login/v1/redirecturl?isFirst=false"
+                },
+            )
+        ]
+        * logins,
+        ("GET", "/rest/pvms/web/login/v1/redirecturl"): [
+            StubResponse(
+                status=302,
+                payload={},
+                url=f"https://{host}/rest/pvms/web/login/v1/redirecturl",
+                headers={"location": "/uniportal/pvmswebsite/assets/build/cloud.html"},
+            )
+        ]
+        * logins,
+    }
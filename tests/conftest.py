@@ -0,0 +1,81 @@
+"""Shared pytest fixtures for FusionSolar tests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from custom_components.huawei_fusionsolar.fusion_solar_api import FusionSolarApiClient
+from tests._fake_http import FakeClientSession, StubResponse, sso_routes
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as json_loads
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def fusionsolar_fixtures() -> dict[str, Any]:
+    """Load the recorded FusionSolar payloads once per test session.
+
+    Payloads are shared between tests and must not be mutated.
+    """
+    return {
+        name: json_loads((FIXTURES_DIR / f"fusionsolar_{name}.json").read_bytes())
+        for name in ("login", "plants", "metrics")
+    }
+
+
+AUTHED_HOST = "la5.fusionsolar.huawei.com"
+
+AuthedClientFactory = Callable[
+    [Mapping[tuple[str, str], Sequence[StubResponse]]],
+    Awaitable[tuple[FusionSolarApiClient, FakeClientSession]],
+]
+
+
+@pytest.fixture
+def authed_client(fusionsolar_fixtures: dict[str, Any]) -> AuthedClientFactory:
+    """Return a factory for a client that has completed a stubbed login.
+
+    Only the endpoint-specific routes need stubbing. The login requests are
+    dropped from ``session.calls`` so tests only see their own traffic.
+    """
+
+    async def _factory(
+        routes: Mapping[tuple[str, str], Sequence[StubResponse]],
+    ) -> tuple[FusionSolarApiClient, FakeClientSession]:
+        session = FakeClientSession(
+            {
+                **sso_routes(AUTHED_HOST, fusionsolar_fixtures["login"]["validate_user"]),
+                **routes,
+            }
+        )
+        client = FusionSolarApiClient(
+            session,
+            username="u",
+            password="p",
+            preferred_host=AUTHED_HOST,
+        )
+        await client.async_login()
+        session.calls.clear()
+        return client, session
+
+    return _factory
+
+
+def pytest_asyncio_loop_factories(
+    config: pytest.Config, item: pytest.Item
+) -> dict[str, Callable[[], asyncio.AbstractEventLoop]]:
+    """Run async tests on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
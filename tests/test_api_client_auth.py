@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -11,113 +10,17 @@ from custom_components.huawei_fusionsolar.fusion_solar_api import (
     FusionSolarApiClient,
     InvalidAuth,
 )
-from tests._fake_http import FakeClientSession, StubResponse
-
-FIXTURES_DIR = Path(__file__).parent / "fixtures"
-
-
-def _prelogin_routes(host: str) -> dict[tuple[str, str], list[StubResponse]]:
-    def many(stub: StubResponse) -> list[StubResponse]:
-        return [stub, stub, stub]
-
-    return {
-        ("GET", "/pvmswebsite/login/build/index.html"): [
-            *many(StubResponse(
-                status=200,
-                payload={"raw": "<html></html>"},
-                url=f"https://{host}/pvmswebsite/login/build/index.html",
-                headers={"content-type": "text/html; charset=UTF-8"},
-            ))
-        ],
-        ("GET", "/rest/pvms/web/security/v1/language"): [
-            *many(StubResponse(
-                status=200,
-                payload={"success": True},
-                url=f"https://{host}/rest/pvms/web/security/v1/language",
-            ))
-        ],
-        ("GET", "/rest/dp/pvms/pvmswebsite/v1/deployment"): [
-            *many(StubResponse(
-                status=200,
-                payload={"success": True},
-                url=f"https://{host}/rest/dp/pvms/pvmswebsite/v1/deployment",
-            ))
-        ],
-        ("GET", "/rest/dp/uidm/unisso/v1/is-check-verify-code"): [
-            *many(StubResponse(
-                status=200,
-                payload={"code": 0, "payload": {"verifyCodeCreate": False}},
-                url=f"https://{host}/rest/dp/uidm/unisso/v1/is-check-verify-code",
-            ))
-        ],
-        ("POST", "/rest/pvms/web/server/v1/servermgmt/list-unforbidden-server"): [
-            *many(StubResponse(
-                status=200,
-                payload={"success": True},
-                url=f"https://{host}/rest/pvms/web/server/v1/servermgmt/list-unforbidden-server",
-            ))
-        ],
-        ("GET", "/rest/dpcloud/auth/v1/keep-alive"): [
-            *many(StubResponse(
-                status=200,
-                payload={"code": 0, "payload": "c-test-roarand"},
-                url=f"https://{host}/rest/dpcloud/auth/v1/keep-alive",
-            ))
-        ],
-    }
+from tests._fake_http import FakeClientSession, StubResponse, prelogin_routes, sso_routes
 
 
 @pytest.mark.asyncio
-async def test_async_login_completes_sso_flow_and_sets_session() -> None:
+async def test_async_login_completes_sso_flow_and_sets_session(
+    fusionsolar_fixtures: dict[str, Any],
+) -> None:
     """Client should execute validate-user -> on-sso -> redirecturl flow."""
-    fixture = json.loads((FIXTURES_DIR / "fusionsolar_login.json").read_text())
+    fixture = fusionsolar_fixtures["login"]
 
-    session = FakeClientSession(
-        {
-            **_prelogin_routes(fixture["host"]),
-            (
-                "POST",
-                "/rest/dp/uidm/unisso/v1/validate-user",
-            ): [
-                StubResponse(
-                    status=200,
-                    payload=fixture["validate_user"],
-                    url=(
-                        f"https://{fixture['host']}"
-                        "/rest/dp/uidm/unisso/v1/validate-user"
-                    ),
-                )
-            ],
-            (
-                "GET",
-                "/rest/dp/uidm/auth/v1/on-sso-credential-ready",
-            ): [
-                StubResponse(
-                    status=302,
-                    payload={},
-                    url=(
-                        f"https://{fixture['host']}"
-                        "/rest/dp/uidm/auth/v1/on-sso-credential-ready"
-                    ),
-                    headers={"location": f"https://{fixture['host']}/rest/pvms/web/login/v1/redirecturl?isFirst=false"},
-                )
-            ],
-            (
-                "GET",
-                "/rest/pvms/web/login/v1/redirecturl",
-            ): [
-                StubResponse(
-                    status=302,
-                    payload={},
-                    url=(
-                        f"https://{fixture['host']}"
-                        "/rest/pvms/web/login/v1/redirecturl"
-                    ),
-                    headers={"location": "/uniportal/pvmswebsite/assets/build/cloud.html"},
-                )
-            ],
-        }
-    )
+    session = FakeClientSession(sso_routes(fixture["host"], fixture["validate_user"]))
 
     client = FusionSolarApiClient(
         session,
@@ -133,14 +36,20 @@ async def test_async_login_completes_sso_flow_and_sets_session() -> None:
 
 
 @pytest.mark.asyncio
-async def test_async_get_plants_retries_after_401_with_relogin() -> None:
+async def test_async_get_plants_retries_after_401_with_relogin(
+    fusionsolar_fixtures: dict[str, Any],
+) -> None:
     """Client should relogin once and retry station-list after auth failure."""
-    plants_payload = json.loads((FIXTURES_DIR / "fusionsolar_plants.json").read_text())
-    login_fixture = json.loads((FIXTURES_DIR / "fusionsolar_login.json").read_text())
+    plants_payload = fusionsolar_fixtures["plants"]
+    login_fixture = fusionsolar_fixtures["login"]
 
     session = FakeClientSession(
         {
-            **_prelogin_routes("la5.fusionsolar.huawei.com"),
+            **sso_routes(
+                "la5.fusionsolar.huawei.com",
+                login_fixture["validate_user"],
+                logins=2,
+            ),
             (
                 "POST",
                 "/rest/pvms/web/station/v1/station/station-list",
@@ -156,38 +65,6 @@ async def test_async_get_plants_retries_after_401_with_relogin() -> None:
                     url="https://la5.fusionsolar.huawei.com/rest/pvms/web/station/v1/station/station-list",
                 ),
             ],
-            (
-                "POST",
-                "/rest/dp/uidm/unisso/v1/validate-user",
-            ): [
-                StubResponse(
-                    status=200,
-                    payload=login_fixture["validate_user"],
-                    url="https://la5.fusionsolar.huawei.com/rest/dp/uidm/unisso/v1/validate-user",
-                )
-            ],
-            (
-                "GET",
-                "/rest/dp/uidm/auth/v1/on-sso-credential-ready",
-            ): [
-                StubResponse(
-                    status=302,
-                    payload={},
-                    url="https://la5.fusionsolar.huawei.com/rest/dp/uidm/auth/v1/on-sso-credential-ready",
-                    headers={"location": "https://la5.fusionsolar.huawei.com/rest/pvms/web/login/v1/redirecturl?isFirst=false"},
-                )
-            ],
-            (
-                "GET",
-                "/rest/pvms/web/login/v1/redirecturl",
-            ): [
-                StubResponse(
-                    status=302,
-                    payload={},
-                    url="https://la5.fusionsolar.huawei.com/rest/pvms/web/login/v1/redirecturl",
-                    headers={"location": "/uniportal/pvmswebsite/assets/build/cloud.html"},
-                )
-            ],
         }
     )
 
@@ -201,7 +78,11 @@ async def test_async_get_plants_retries_after_401_with_relogin() -> None:
 
     assert len(plants) == 2
     assert plants[0].plant_id == "NE=10000001"
-    assert session.calls.count(("POST", "/rest/dp/uidm/unisso/v1/validate-user")) == 1
+    # One login to open the session, and exactly one relogin after the 401.
+    assert session.calls.count(("POST", "/rest/dp/uidm/unisso/v1/validate-user")) == 2
+    assert session.calls.count(
+        ("POST", "/rest/pvms/web/station/v1/station/station-list")
+    ) == 2
 
 
 @pytest.mark.asyncio
@@ -209,7 +90,7 @@ async def test_async_login_raises_invalid_auth() -> None:
     """Invalid auth payload must raise InvalidAuth."""
     session = FakeClientSession(
         {
-            **_prelogin_routes("la5.fusionsolar.huawei.com"),
+            **prelogin_routes("la5.fusionsolar.huawei.com"),
             (
                 "POST",
                 "/rest/dp/uidm/unisso/v1/validate-user",
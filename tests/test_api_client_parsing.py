@@ -2,124 +2,37 @@
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
+from typing import Any
 
 import pytest
 
+from custom_components.huawei_fusionsolar import fusion_solar_api
 from custom_components.huawei_fusionsolar.fusion_solar_api import FusionSolarApiClient
-from tests._fake_http import FakeClientSession, StubResponse
-
-FIXTURES_DIR = Path(__file__).parent / "fixtures"
-
-
-def _prelogin_routes(host: str) -> dict[tuple[str, str], list[StubResponse]]:
-    def many(stub: StubResponse) -> list[StubResponse]:
-        return [stub, stub, stub]
-
-    return {
-        ("GET", "/pvmswebsite/login/build/index.html"): [
-            *many(StubResponse(
-                status=200,
-                payload={"raw": "<html></html>"},
-                url=f"https://{host}/pvmswebsite/login/build/index.html",
-                headers={"content-type": "text/html; charset=UTF-8"},
-            ))
-        ],
-        ("GET", "/rest/pvms/web/security/v1/language"): [
-            *many(StubResponse(
-                status=200,
-                payload={"success": True},
-                url=f"https://{host}/rest/pvms/web/security/v1/language",
-            ))
-        ],
-        ("GET", "/rest/dp/pvms/pvmswebsite/v1/deployment"): [
-            *many(StubResponse(
-                status=200,
-                payload={"success": True},
-                url=f"https://{host}/rest/dp/pvms/pvmswebsite/v1/deployment",
-            ))
-        ],
-        ("GET", "/rest/dp/uidm/unisso/v1/is-check-verify-code"): [
-            *many(StubResponse(
-                status=200,
-                payload={"code": 0, "payload": {"verifyCodeCreate": False}},
-                url=f"https://{host}/rest/dp/uidm/unisso/v1/is-check-verify-code",
-            ))
-        ],
-        ("POST", "/rest/pvms/web/server/v1/servermgmt/list-unforbidden-server"): [
-            *many(StubResponse(
-                status=200,
-                payload={"success": True},
-                url=f"https://{host}/rest/pvms/web/server/v1/servermgmt/list-unforbidden-server",
-            ))
-        ],
-        ("GET", "/rest/dpcloud/auth/v1/keep-alive"): [
-            *many(StubResponse(
-                status=200,
-                payload={"code": 0, "payload": "c-test-roarand"},
-                url=f"https://{host}/rest/dpcloud/auth/v1/keep-alive",
-            ))
-        ],
-    }
+from tests._fake_http import FakeClientSession, StubResponse, sso_routes
+from tests.conftest import AuthedClientFactory
+
+HOST = "la5.fusionsolar.huawei.com"
 
 
 @pytest.mark.asyncio
-async def test_async_get_plants_parses_station_list() -> None:
+async def test_async_get_plants_parses_station_list(
+    fusionsolar_fixtures: dict[str, Any],
+) -> None:
     """Plant list should normalize station DNs and names."""
-    plants_payload = json.loads((FIXTURES_DIR / "fusionsolar_plants.json").read_text())
+    plants_payload = fusionsolar_fixtures["plants"]
+    station_list = StubResponse(
+        status=200,
+        payload=plants_payload,
+        url=f"https://{HOST}/rest/pvms/web/station/v1/station/station-list",
+    )
 
     session = FakeClientSession(
         {
-            **_prelogin_routes("la5.fusionsolar.huawei.com"),
+            **sso_routes(HOST, fusionsolar_fixtures["login"]["validate_user"]),
             (
                 "POST",
                 "/rest/pvms/web/station/v1/station/station-list",
-            ): [
-                StubResponse(
-                    status=200,
-                    payload=plants_payload,
-                    url="https://la5.fusionsolar.huawei.com/rest/pvms/web/station/v1/station/station-list",
-                )
-            ],
-            (
-                "POST",
-                "/rest/dp/uidm/unisso/v1/validate-user",
-            ): [
-                StubResponse(
-                    status=200,
-                    payload={
-                        "code": 0,
-                        "payload": {
-                            "ticket": "ST-example-ticket",
-                            "redirectURL": "/rest/dp/uidm/auth/v1/on-sso-credential-ready?ticket=ST-example-ticket",
-                        },
-                    },
-                    url="https://la5.fusionsolar.huawei.com/rest/dp/uidm/unisso/v1/validate-user",
-                )
-            ],
-            (
-                "GET",
-                "/rest/dp/uidm/auth/v1/on-sso-credential-ready",
-            ): [
-                StubResponse(
-                    status=302,
-                    payload={},
-                    url="https://la5.fusionsolar.huawei.com/rest/dp/uidm/auth/v1/on-sso-credential-ready",
-                    headers={"location": "https://la5.fusionsolar.huawei.com/rest/pvms/web/login/v1/redirecturl?isFirst=false"},
-                )
-            ],
-            (
-                "GET",
-                "/rest/pvms/web/login/v1/redirecturl",
-            ): [
-                StubResponse(
-                    status=302,
-                    payload={},
-                    url="https://la5.fusionsolar.huawei.com/rest/pvms/web/login/v1/redirecturl",
-                    headers={"location": "/uniportal/pvmswebsite/assets/build/cloud.html"},
-                )
-            ],
+            ): [station_list],
         }
     )
 
@@ -131,13 +44,88 @@ async def test_async_get_plants_parses_station_list() -> None:
 
 
 @pytest.mark.asyncio
-async def test_async_get_metrics_normalizes_power_and_energy() -> None:
+async def test_async_get_plants_skips_keepalive_within_confirmed_window(
+    fusionsolar_fixtures: dict[str, Any],
+    authed_client: AuthedClientFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A poll shortly after a successful response reuses the confirmed session."""
+    station_list = StubResponse(
+        status=200,
+        payload=fusionsolar_fixtures["plants"],
+        url=f"https://{HOST}/rest/pvms/web/station/v1/station/station-list",
+    )
+    client, session = await authed_client(
+        {
+            (
+                "POST",
+                "/rest/pvms/web/station/v1/station/station-list",
+            ): [station_list] * 3,
+        }
+    )
+    keepalive = ("GET", "/rest/dpcloud/auth/v1/keep-alive")
+
+    await client.async_get_plants()
+    await client.async_get_plants()
+    assert session.calls.count(keepalive) == 1
+
+    # Once the window has passed the session is confirmed again first.
+    monotonic = fusion_solar_api.time.monotonic
+    monkeypatch.setattr(
+        fusion_solar_api.time,
+        "monotonic",
+        lambda: monotonic() + fusion_solar_api.SESSION_CONFIRMED_SECONDS,
+    )
+    await client.async_get_plants()
+    assert session.calls.count(keepalive) == 2
+
+
+@pytest.mark.asyncio
+async def test_prelogin_probes_do_not_confirm_the_session(
+    fusionsolar_fixtures: dict[str, Any],
+    authed_client: AuthedClientFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Unauthenticated probe responses never let a poll skip the keep-alive."""
+    station_list = StubResponse(
+        status=200,
+        payload=fusionsolar_fixtures["plants"],
+        url=f"https://{HOST}/rest/pvms/web/station/v1/station/station-list",
+    )
+    client, session = await authed_client(
+        {
+            **sso_routes(HOST, fusionsolar_fixtures["login"]["validate_user"], logins=2),
+            (
+                "POST",
+                "/rest/pvms/web/station/v1/station/station-list",
+            ): [station_list] * 2,
+        }
+    )
+    keepalive = ("GET", "/rest/dpcloud/auth/v1/keep-alive")
+    await client.async_get_plants()
+    assert session.calls.count(keepalive) == 1
+
+    monotonic = fusion_solar_api.time.monotonic
+    monkeypatch.setattr(
+        fusion_solar_api.time,
+        "monotonic",
+        lambda: monotonic() + fusion_solar_api.SESSION_CONFIRMED_SECONDS,
+    )
+    await client.async_login()
+    await client.async_get_plants()
+    assert session.calls.count(keepalive) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_get_metrics_normalizes_power_and_energy(
+    fusionsolar_fixtures: dict[str, Any],
+    authed_client: AuthedClientFactory,
+) -> None:
     """KPI payload should normalize currentPower(kW) -> W and expose kWh fields."""
-    fixture = json.loads((FIXTURES_DIR / "fusionsolar_metrics.json").read_text())
+    fixture = fusionsolar_fixtures["metrics"]
 
-    session = FakeClientSession(
+    client, session = await authed_client(
         {
-            **_prelogin_routes("la5.fusionsolar.huawei.com"),
             (
                 "GET",
                 "/rest/pvms/web/station/v1/overview/station-real-kpi",
@@ -145,51 +133,12 @@ async def test_async_get_metrics_normalizes_power_and_energy() -> None:
                 StubResponse(
                     status=200,
                     payload=fixture,
-                    url="https://la5.fusionsolar.huawei.com/rest/pvms/web/station/v1/overview/station-real-kpi",
-                )
-            ],
-            (
-                "POST",
-                "/rest/dp/uidm/unisso/v1/validate-user",
-            ): [
-                StubResponse(
-                    status=200,
-                    payload={
-                        "code": 0,
-                        "payload": {
-                            "ticket": "ST-example-ticket",
-                            "redirectURL": "/rest/dp/uidm/auth/v1/on-sso-credential-ready?ticket=ST-example-ticket",
-                        },
-                    },
-                    url="https://la5.fusionsolar.huawei.com/rest/dp/uidm/unisso/v1/validate-user",
-                )
-            ],
-            (
-                "GET",
-                "/rest/dp/uidm/auth/v1/on-sso-credential-ready",
-            ): [
-                StubResponse(
-                    status=302,
-                    payload={},
-                    url="https://la5.fusionsolar.huawei.com/rest/dp/uidm/auth/v1/on-sso-credential-ready",
-                    headers={"location": "https://la5.fusionsolar.huawei.com/rest/pvms/web/login/v1/redirecturl?isFirst=false"},
-                )
-            ],
-            (
-                "GET",
-                "/rest/pvms/web/login/v1/redirecturl",
-            ): [
-                StubResponse(
-                    status=302,
-                    payload={},
-                    url="https://la5.fusionsolar.huawei.com/rest/pvms/web/login/v1/redirecturl",
-                    headers={"location": "/uniportal/pvmswebsite/assets/build/cloud.html"},
+                    url=f"https://{HOST}/rest/pvms/web/station/v1/overview/station-real-kpi",
                 )
             ],
         }
     )
 
-    client = FusionSolarApiClient(session, username="u", password="p")
     snapshot = await client.async_get_metrics("NE=10000001")
 
     assert snapshot.plant_id == "NE=10000001"
@@ -198,3 +147,42 @@ async def test_async_get_metrics_normalizes_power_and_energy() -> None:
     assert snapshot.energy_month_kwh == 105.62
     assert snapshot.energy_year_kwh == 105.62
     assert snapshot.energy_total_kwh == 105.62
+
+
+@pytest.mark.asyncio
+async def test_async_get_metrics_cache_honours_ttl_and_size(
+    fusionsolar_fixtures: dict[str, Any],
+    authed_client: AuthedClientFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Metrics are reused within the TTL and the cache keeps the newest plants."""
+    kpi_stub = StubResponse(
+        status=200,
+        payload=fusionsolar_fixtures["metrics"],
+        url=f"https://{HOST}/rest/pvms/web/station/v1/overview/station-real-kpi",
+    )
+    client, session = await authed_client(
+        {("GET", "/rest/pvms/web/station/v1/overview/station-real-kpi"): [kpi_stub] * 36}
+    )
+    kpi = ("GET", "/rest/pvms/web/station/v1/overview/station-real-kpi")
+    client.set_metrics_cache_ttl(60)
+
+    snapshot = await client.async_get_metrics("NE=10000001")
+    assert await client.async_get_metrics("NE=10000001") is snapshot
+    assert session.calls.count(kpi) == 1
+
+    monotonic = fusion_solar_api.time.monotonic
+    monkeypatch.setattr(fusion_solar_api.time, "monotonic", lambda: monotonic() + 60)
+    refreshed = await client.async_get_metrics("NE=10000001")
+    assert refreshed is not snapshot
+    assert session.calls.count(kpi) == 2
+
+    # 32 more plants push the oldest entry out of the cache.
+    for index in range(2, 2 + fusion_solar_api.METRICS_CACHE_MAX_ENTRIES):
+        await client.async_get_metrics(f"NE={10000000 + index}")
+    assert session.calls.count(kpi) == 34
+
+    await client.async_get_metrics(f"NE={10000000 + 33}")
+    assert session.calls.count(kpi) == 34
+    await client.async_get_metrics("NE=10000001")
+    assert session.calls.count(kpi) == 35
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 import pytest
 
 pytest.importorskip("homeassistant")
@@ -10,8 +12,19 @@ from custom_components.huawei_fusionsolar import config_flow
 from custom_components.huawei_fusionsolar.fusion_solar_api import InvalidAuth, PlantInfo
 
 
+@pytest.fixture
+def use_client(monkeypatch: pytest.MonkeyPatch) -> Callable[[type], None]:
+    """Stub the shared session and return a setter for the flow's API client."""
+    monkeypatch.setattr(config_flow, "async_get_clientsession", lambda hass, verify_ssl: object())
+
+    def _use_client(client_cls: type) -> None:
+        monkeypatch.setattr(config_flow, "FusionSolarApiClient", client_cls)
+
+    return _use_client
+
+
 @pytest.mark.asyncio
-async def test_validate_input_returns_effective_host_and_plant_index(monkeypatch) -> None:
+async def test_validate_input_returns_effective_host_and_plant_index(use_client) -> None:
     """Validation helper should return normalized plant discovery data."""
 
     class FakeClient:
@@ -24,8 +37,7 @@ async def test_validate_input_returns_effective_host_and_plant_index(monkeypatch
         async def async_get_plants(self) -> list[PlantInfo]:
             return [PlantInfo("plant-001", "Casa Norte")]
 
-    monkeypatch.setattr(config_flow, "async_get_clientsession", lambda hass, verify_ssl: object())
-    monkeypatch.setattr(config_flow, "FusionSolarApiClient", FakeClient)
+    use_client(FakeClient)
 
     result = await config_flow._async_validate_input(
         hass=object(),
@@ -42,7 +54,7 @@ async def test_validate_input_returns_effective_host_and_plant_index(monkeypatch
 
 
 @pytest.mark.asyncio
-async def test_validate_input_propagates_invalid_auth(monkeypatch) -> None:
+async def test_validate_input_propagates_invalid_auth(use_client) -> None:
     """Validation helper should bubble auth failures for the flow layer."""
 
     class FakeClient:
@@ -55,8 +67,7 @@ async def test_validate_input_propagates_invalid_auth(monkeypatch) -> None:
         async def async_get_plants(self) -> list[PlantInfo]:
             return []
 
-    monkeypatch.setattr(config_flow, "async_get_clientsession", lambda hass, verify_ssl: object())
-    monkeypatch.setattr(config_flow, "FusionSolarApiClient", FakeClient)
+    use_client(FakeClient)
 
     with pytest.raises(InvalidAuth):
         await config_flow._async_validate_input(
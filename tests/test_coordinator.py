@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 
 import pytest
+import pytest_asyncio
 
 pytest.importorskip("homeassistant")
 
@@ -37,6 +38,12 @@ class FakeHass:
         self.loop = asyncio.get_running_loop()
 
 
+@pytest_asyncio.fixture
+async def fake_hass() -> FakeHass:
+    """Return a FakeHass bound to the running test loop."""
+    return FakeHass()
+
+
 class FakeApi:
     """Simple API stub for coordinator tests."""
 
@@ -50,6 +57,9 @@ class FakeApi:
     def set_preferred_host(self, host: str | None) -> None:
         return None
 
+    def set_metrics_cache_ttl(self, ttl_seconds: float) -> None:
+        return None
+
     async def async_get_plants(self) -> list[PlantInfo]:
         if isinstance(self._plants, Exception):
             raise self._plants
@@ -63,7 +73,7 @@ class FakeApi:
 
 
 @pytest.mark.asyncio
-async def test_coordinator_keeps_previous_snapshot_on_partial_failure() -> None:
+async def test_coordinator_keeps_previous_snapshot_on_partial_failure(fake_hass: FakeHass) -> None:
     """If one plant fails, previous data for that plant should be preserved."""
     now = datetime.now(UTC)
     plants = [
@@ -106,7 +116,7 @@ async def test_coordinator_keeps_previous_snapshot_on_partial_failure() -> None:
         options={},
     )
 
-    coordinator = FusionSolarDataUpdateCoordinator(FakeHass(), entry, api)
+    coordinator = FusionSolarDataUpdateCoordinator(fake_hass, entry, api)
     coordinator.data = {"plant-002": old_snapshot}
 
     data = await coordinator._async_update_data()
@@ -116,11 +126,87 @@ async def test_coordinator_keeps_previous_snapshot_on_partial_failure() -> None:
 
 
 @pytest.mark.asyncio
-async def test_coordinator_raises_reauth_on_invalid_auth() -> None:
+async def test_coordinator_raises_reauth_on_invalid_auth(fake_hass: FakeHass) -> None:
     """Invalid auth from API should trigger Home Assistant reauth flow."""
     api = FakeApi(plants=InvalidAuth("bad creds"), metric_map={})
     entry = FakeEntry(entry_id="entry-2", data={}, options={})
-    coordinator = FusionSolarDataUpdateCoordinator(FakeHass(), entry, api)
+    coordinator = FusionSolarDataUpdateCoordinator(fake_hass, entry, api)
+
+    with pytest.raises(ConfigEntryAuthFailed):
+        await coordinator._async_update_data()
+
+
+@pytest.mark.asyncio
+async def test_coordinator_shares_inflight_metrics_request(fake_hass: FakeHass) -> None:
+    """Concurrent fetches for one plant should issue a single API request."""
+    now = datetime.now(UTC)
+    snapshot = PlantSnapshot(
+        plant_id="plant-001",
+        plant_name="Casa Norte",
+        power_w=3200,
+        energy_today_kwh=12,
+        energy_month_kwh=200,
+        energy_year_kwh=1100,
+        energy_total_kwh=8000,
+        updated_at_utc=now,
+    )
+    release = asyncio.Event()
+    calls: list[str] = []
+
+    class SlowApi(FakeApi):
+        async def async_get_metrics(self, plant_id: str) -> PlantSnapshot:
+            calls.append(plant_id)
+            await release.wait()
+            return snapshot
+
+    api = SlowApi(plants=[], metric_map={})
+    entry = FakeEntry(entry_id="entry-3", data={}, options={"max_concurrent_fetches": 1})
+    coordinator = FusionSolarDataUpdateCoordinator(fake_hass, entry, api)
+
+    first = asyncio.ensure_future(coordinator._async_fetch_metrics("plant-001"))
+    second = asyncio.ensure_future(coordinator._async_fetch_metrics("plant-001"))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == snapshot
+    assert await second == snapshot
+    assert calls == ["plant-001"]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_backoff_saturates_at_max(fake_hass: FakeHass) -> None:
+    """Repeated failures should double the interval until the cap, then hold."""
+    api = FakeApi(plants=[], metric_map={})
+    entry = FakeEntry(entry_id="entry-4", data={}, options={"poll_interval_seconds": 60})
+    coordinator = FusionSolarDataUpdateCoordinator(fake_hass, entry, api)
+
+    intervals = []
+    for _ in range(10):
+        coordinator._apply_backoff()
+        intervals.append(int(coordinator.update_interval.total_seconds()))
+
+    assert intervals == [120, 240, 480, 600, 600, 600, 600, 600, 600, 600]
+
+    coordinator._clear_backoff()
+    assert int(coordinator.update_interval.total_seconds()) == 60
+
+
+@pytest.mark.asyncio
+async def test_coordinator_raises_reauth_on_metrics_invalid_auth(fake_hass: FakeHass) -> None:
+    """Auth failure on one plant should abort the whole update for reauth."""
+    plants = [
+        PlantInfo("plant-001", "Casa Norte"),
+        PlantInfo("plant-002", "Casa Sur"),
+    ]
+    api = FakeApi(
+        plants=plants,
+        metric_map={
+            "plant-001": InvalidAuth("expired"),
+            "plant-002": CannotConnect("timeout"),
+        },
+    )
+    entry = FakeEntry(entry_id="entry-5", data={}, options={})
+    coordinator = FusionSolarDataUpdateCoordinator(fake_hass, entry, api)
 
     with pytest.raises(ConfigEntryAuthFailed):
         await coordinator._async_update_data()
@@ -0,0 +1,52 @@
+"""Diagnostics tests for FusionSolar integration."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.components.diagnostics import REDACTED
+
+from custom_components.huawei_fusionsolar.const import DOMAIN
+from custom_components.huawei_fusionsolar.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+@pytest.mark.asyncio
+async def test_runtime_secrets_are_redacted_at_any_depth() -> None:
+    """Nested, mixed-case secret keys in runtime state are redacted."""
+    api_state = {
+        "effective_host": "la5.fusionsolar.huawei.com",
+        "Token": "top-level-secret",
+        "hosts": [{"name": "la5", "auth": {"Password": "hunter2", "TOKEN": "abc"}}],
+        "cookies_seen": {"Cookie": None},
+    }
+    runtime = SimpleNamespace(
+        api=SimpleNamespace(get_debug_state=lambda: api_state),
+        coordinator=SimpleNamespace(diagnostics_payload=lambda: {"plants": 2}),
+    )
+    entry = SimpleNamespace(
+        entry_id="entry-1",
+        data={"username": "someone@example.com", "password": "p"},
+        options={},
+    )
+    hass = SimpleNamespace(data={DOMAIN: {entry.entry_id: runtime}})
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["config_entry"] == {"password": REDACTED}
+    assert diagnostics["runtime"] == {
+        "api": {
+            "effective_host": "la5.fusionsolar.huawei.com",
+            "Token": REDACTED,
+            "hosts": [{"name": "la5", "auth": {"Password": REDACTED, "TOKEN": REDACTED}}],
+            "cookies_seen": {"Cookie": None},
+        },
+        "coordinator": {"plants": 2},
+    }
+    # The source payload is copied, not redacted in place.
+    assert api_state["hosts"][0]["auth"]["Password"] == "hunter2"
@@ -0,0 +1,203 @@
+"""Sensor platform tests for FusionSolar integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.huawei_fusionsolar import sensor
+from custom_components.huawei_fusionsolar.const import DOMAIN
+from custom_components.huawei_fusionsolar.fusion_solar_api import PlantSnapshot
+
+
+def _snapshot(plant_id: str, power_w: float = 1000, **changes: Any) -> PlantSnapshot:
+    values: dict[str, Any] = {
+        "plant_id": plant_id,
+        "plant_name": f"Plant {plant_id}",
+        "power_w": power_w,
+        "energy_today_kwh": 5,
+        "energy_month_kwh": 70,
+        "energy_year_kwh": 300,
+        "energy_total_kwh": 2400,
+        "updated_at_utc": datetime.now(UTC),
+    }
+    values.update(changes)
+    return PlantSnapshot(**values)
+
+
+class FakeCoordinator:
+    """Coordinator subset used by the sensor platform."""
+
+    def __init__(self, data: dict[str, PlantSnapshot]) -> None:
+        self.data = data
+        self.last_update_success = True
+        self.known_plants: dict[str, str] = {}
+        self.listeners: list[Callable[[], None]] = []
+
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        self.listeners.append(update_callback)
+        return lambda: self.listeners.remove(update_callback)
+
+    def push(self, data: dict[str, PlantSnapshot] | None = None) -> None:
+        if data is not None:
+            self.data = data
+        for update_callback in list(self.listeners):
+            update_callback()
+
+
+class FakeEntry:
+    """ConfigEntry subset used by the sensor platform."""
+
+    def __init__(self) -> None:
+        self.entry_id = "entry-1"
+        self.unload_callbacks: list[Callable[[], None]] = []
+
+    def async_on_unload(self, func: Callable[[], None]) -> None:
+        self.unload_callbacks.append(func)
+
+
+async def _async_setup_platform(
+    coordinator: FakeCoordinator,
+) -> list[sensor.FusionSolarSensor]:
+    """Run the platform setup and add every created entity like HA would."""
+    entry = FakeEntry()
+    hass = SimpleNamespace(
+        data={DOMAIN: {entry.entry_id: SimpleNamespace(coordinator=coordinator)}}
+    )
+    added: list[sensor.FusionSolarSensor] = []
+
+    def _add_entities(new_entities: list[sensor.FusionSolarSensor]) -> None:
+        added.extend(new_entities)
+
+    await sensor.async_setup_entry(hass, entry, _add_entities)
+    return added
+
+
+async def _async_add_to_hass(entities: list[sensor.FusionSolarSensor]) -> None:
+    for entity in entities:
+        await entity.async_added_to_hass()
+
+
+def _track_writes(entities: list[sensor.FusionSolarSensor]) -> list[str | None]:
+    writes: list[str | None] = []
+    for entity in entities:
+        entity.async_write_ha_state = (  # type: ignore[method-assign]
+            lambda entity=entity: writes.append(entity.unique_id)
+        )
+    return writes
+
+
+@pytest.mark.asyncio
+async def test_identical_poll_does_not_write_state() -> None:
+    """A poll with unchanged telemetry but a new parse time skips state writes."""
+    first = _snapshot("plant-001")
+    coordinator = FakeCoordinator({"plant-001": first})
+    hub = sensor._PlantHub(coordinator, "plant-001")
+    entities = [sensor.FusionSolarSensor(hub, d) for d in sensor.SENSOR_DESCRIPTIONS]
+    writes = _track_writes(entities)
+    for entity in entities:
+        await entity.async_added_to_hass()
+
+    later = first.updated_at_utc + timedelta(minutes=1)
+    coordinator.push({"plant-001": _snapshot("plant-001", updated_at_utc=later)})
+    assert writes == []
+
+    coordinator.push({"plant-001": _snapshot("plant-001", power_w=2000)})
+    assert len(writes) == len(sensor.SENSOR_DESCRIPTIONS)
+    assert entities[0].native_value == 2000
+
+
+@pytest.mark.asyncio
+async def test_setup_registers_one_listener_per_plant() -> None:
+    """Five sensors per plant share a single coordinator listener."""
+    coordinator = FakeCoordinator(
+        {"plant-001": _snapshot("plant-001"), "plant-002": _snapshot("plant-002")}
+    )
+    entities = await _async_setup_platform(coordinator)
+    # The platform itself listens for newly discovered plants.
+    assert len(coordinator.listeners) == 1
+
+    await _async_add_to_hass(entities)
+
+    assert len(entities) == 2 * len(sensor.SENSOR_DESCRIPTIONS)
+    assert len(coordinator.listeners) == 1 + 2
+
+
+@pytest.mark.asyncio
+async def test_removing_all_plant_sensors_drops_the_listener() -> None:
+    """The plant listener stays until its last sensor is removed."""
+    coordinator = FakeCoordinator({"plant-001": _snapshot("plant-001")})
+    entities = await _async_setup_platform(coordinator)
+    await _async_add_to_hass(entities)
+    assert len(coordinator.listeners) == 2
+
+    for entity in entities[:-1]:
+        entity.add_to_platform_abort()
+    assert len(coordinator.listeners) == 2
+
+    entities[-1].add_to_platform_abort()
+    assert len(coordinator.listeners) == 1
+
+
+@pytest.mark.asyncio
+async def test_readded_sensor_starts_from_current_data() -> None:
+    """A sensor re-added after its hub unsubscribed does not show stale data."""
+    coordinator = FakeCoordinator({"plant-001": _snapshot("plant-001")})
+    entities = await _async_setup_platform(coordinator)
+    await _async_add_to_hass(entities)
+    for entity in entities:
+        entity.add_to_platform_abort()
+
+    coordinator.data = {"plant-001": _snapshot("plant-001", power_w=2500)}
+    coordinator.last_update_success = False
+    await entities[0].async_added_to_hass()
+
+    assert len(coordinator.listeners) == 2
+    assert entities[0].native_value == 2500
+    assert not entities[0].available
+
+
+@pytest.mark.asyncio
+async def test_availability_follows_coordinator_update_success() -> None:
+    """A failed refresh marks sensors unavailable even though data is unchanged."""
+    coordinator = FakeCoordinator({"plant-001": _snapshot("plant-001")})
+    entities = await _async_setup_platform(coordinator)
+    writes = _track_writes(entities)
+    await _async_add_to_hass(entities)
+    assert all(entity.available for entity in entities)
+
+    coordinator.last_update_success = False
+    coordinator.push()
+
+    assert not any(entity.available for entity in entities)
+    assert len(writes) == len(entities)
+
+    coordinator.last_update_success = True
+    coordinator.push()
+    assert all(entity.available for entity in entities)
+
+
+@pytest.mark.asyncio
+async def test_new_plants_are_added_on_coordinator_update() -> None:
+    """A plant appearing in a later poll gets its sensors added once."""
+    coordinator = FakeCoordinator({"plant-001": _snapshot("plant-001")})
+    entities = await _async_setup_platform(coordinator)
+    assert {entity.unique_id for entity in entities} == {
+        f"plant-001_{description.key}" for description in sensor.SENSOR_DESCRIPTIONS
+    }
+
+    coordinator.push(
+        {"plant-001": _snapshot("plant-001"), "plant-002": _snapshot("plant-002")}
+    )
+    coordinator.push()
+
+    assert len(entities) == 2 * len(sensor.SENSOR_DESCRIPTIONS)
+    assert {entity.unique_id for entity in entities[len(sensor.SENSOR_DESCRIPTIONS):]} == {
+        f"plant-002_{description.key}" for description in sensor.SENSOR_DESCRIPTIONS
+    }